@@ -5,18 +5,43 @@ Flaskアプリケーションの初期化と設定を行います。
 各ブループリントを登録し、アプリケーションを起動します。
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import os
 from pathlib import Path
+import queue
 import sys
 
 from my_properties import MyProperties
 from flask import Flask
 from flask_cors import CORS
-from routes import artwork_bp, health_bp
+import routes
 from services.artwork_service import ArtworkService
 
 
+# ログキューに溜められるレコード数の上限（リスナーが停止していてもメモリを使い切らないようにする。
+# 上限に達した場合、そのレコードは破棄され、QueueHandler.handleError が標準エラー出力に報告する）
+LOG_QUEUE_MAX_SIZE = 10000
+
+
+def _start_log_listener(queue_handler: QueueHandler, *handlers: logging.Handler) -> QueueListener:
+    """新しいログキューとリスナースレッドを作成し、QueueHandler の出力先を切り替える.
+
+    Args:
+        queue_handler: アプリケーションのロガーに登録した QueueHandler
+        handlers: リスナースレッドで実際に出力するハンドラー
+
+    Returns:
+        開始したリスナー"""
+    log_queue: queue.Queue = queue.Queue(LOG_QUEUE_MAX_SIZE)
+    queue_handler.queue = log_queue
+    log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    log_listener.start()
+    atexit.register(log_listener.stop)
+    return log_listener
+
+
 def create_app() -> Flask:
     """
     Flaskアプリケーションのファクトリ関数.
@@ -32,43 +57,54 @@ def create_app() -> Flask:
 
     app = Flask(__name__)
 
-    # サービスの初期化（appインスタンスに保持し、テスト時に差し替え可能にする）
-    app.artwork_service = ArtworkService()
+    # サービスの初期化（ルートは app.artwork_service_provider() 経由で取得するため、
+    # テスト時はプロバイダを差し替えるだけでアプリケーションを作り直さずにモックを注入できる）
+    artwork_service = ArtworkService()
+    app.artwork_service_provider = lambda: artwork_service
 
     # CORS設定
     CORS(app, origins=[MyProperties.FRONTEND_URL()])
 
     # ブループリントの登録
-    app.register_blueprint(health_bp)
-    app.register_blueprint(artwork_bp)
+    routes.register(app)
 
     # ログ設定（常にファイルに出力）
     log_dir = Path("/app/logs")
     log_dir.mkdir(parents=True, exist_ok=True)
 
+    # 呼び出し元のファイル名・行番号はログ出力に使用しないため、ログ呼び出しごとの
+    # スタックフレームの探索（Logger.findCaller）を無効化する（Logging HOWTO の最適化手法）。
+    # エラーログは exc_info=True でトレースバックを出力するため、発生箇所は失われない
+    logging._srcfile = None
+    log_formatter = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
+
     # アプリケーションログ
     file_handler = RotatingFileHandler(
         log_dir / "app.log", maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
     )
     file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(
-        logging.Formatter(
-            "%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]"
-        )
-    )
-    app.logger.addHandler(file_handler)
+    file_handler.setFormatter(log_formatter)
 
     # エラーログ
     error_handler = RotatingFileHandler(
         log_dir / "error.log", maxBytes=10 * 1024 * 1024, backupCount=5  # 10MB
     )
     error_handler.setLevel(logging.ERROR)
-    error_handler.setFormatter(
-        logging.Formatter(
-            "%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]"
-        )
+    error_handler.setFormatter(log_formatter)
+
+    # ファイルへの書き込み（およびローテーション）はリスナースレッドで行い、
+    # リクエスト処理側はキューへの追加だけで済むようにする
+    queue_handler = QueueHandler(queue.Queue(LOG_QUEUE_MAX_SIZE))
+    app.logger.addHandler(queue_handler)
+    _start_log_listener(queue_handler, file_handler, error_handler)
+
+    # スレッドは fork で子プロセスに引き継がれないため、このモジュールをインポートしてから
+    # fork するサーバー（gunicorn の --preload など）では、ワーカーのリスナーが存在せず
+    # ログがキューに溜まり続ける。fork 直後の子プロセスで新しいキューとリスナーを開始する
+    # （親プロセスのキューはリスナースレッドがロックを保持したまま複製された可能性があるため使わない）
+    os.register_at_fork(
+        after_in_child=lambda: _start_log_listener(queue_handler, file_handler, error_handler)
     )
-    app.logger.addHandler(error_handler)
 
     app.logger.setLevel(logging.INFO)
     app.logger.info("Application startup")
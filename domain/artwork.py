@@ -6,10 +6,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Iterable, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Artwork:
     """作品エンティティ.
 
@@ -76,12 +76,17 @@ class Artwork:
 
         Returns:
             Artworkエンティティのインスタンス"""
+        # psycopg2 は NUMERIC を Decimal で返すため、それ以外の型の場合のみ変換する
+        price = data.get("price")
+        if price is not None and not isinstance(price, Decimal):
+            price = Decimal(str(price))
+
         return cls(
             id=data.get("id"),
             title=data.get("title", ""),
             description=data.get("description"),
             image_url=data.get("image_url"),
-            price=Decimal(str(data["price"])) if data.get("price") else None,
+            price=price,
             size=data.get("size"),
             medium=data.get("medium"),
             year=data.get("year"),
@@ -91,11 +96,41 @@ class Artwork:
             updated_at=data.get("updated_at"),
         )
 
-    def to_dict(self) -> dict:
-        """エンティティを辞書形式に変換.
+    @classmethod
+    def from_row(cls, row: tuple) -> "Artwork":
+        """データベースの行（タプル）からArtworkエンティティを生成するファクトリメソッド.
+
+        行の列はフィールドと同じ順序（id, title, ..., updated_at）で並んでいる必要があります。
+
+        Args:
+            row: タプルを返すカーソルから取得した行
 
         Returns:
-            辞書形式のデータ"""
+            Artworkエンティティのインスタンス"""
+        return cls(*row)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> List["Artwork"]:
+        """データベースの複数の行（タプル）からArtworkエンティティのリストを生成するファクトリメソッド.
+
+        Args:
+            rows: タプルを返すカーソルから取得した行
+
+        Returns:
+            Artworkエンティティのリスト"""
+        # ループ内での属性参照を避けるため、コンストラクタをローカル変数に束縛する
+        artwork = cls
+        return [artwork(*row) for row in rows]
+
+    def to_json_dict(self) -> dict:
+        """エンティティを JSON シリアライズ用の辞書形式に変換.
+
+        キーと価格の形式は to_dict() と同じですが、日時は datetime のまま返します。
+        orjson は datetime を isoformat() と同じ形式で直接出力するため、作品一覧の
+        シリアライズでは作品ごとの日時の文字列変換を省けます。
+
+        Returns:
+            辞書形式のデータ（created_at・updated_at は datetime または None）"""
         return {
             "id": self.id,
             "title": self.title,
@@ -107,6 +142,18 @@ class Artwork:
             "year": self.year,
             "is_featured": self.is_featured,
             "is_sold": self.is_sold,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
+
+    def to_dict(self) -> dict:
+        """エンティティを辞書形式に変換.
+
+        Returns:
+            辞書形式のデータ"""
+        data = self.to_json_dict()
+        if self.created_at:
+            data["created_at"] = self.created_at.isoformat()
+        if self.updated_at:
+            data["updated_at"] = self.updated_at.isoformat()
+        return data
@@ -0,0 +1,3 @@
+-- 作品一覧（ArtworkRepository.find_all）の ORDER BY created_at DESC LIMIT ... を
+-- インデックスの走査だけで処理できるようにする
+CREATE INDEX IF NOT EXISTS artworks_created_at_desc_idx ON artworks (created_at DESC);
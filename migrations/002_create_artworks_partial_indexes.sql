@@ -0,0 +1,9 @@
+-- おすすめ作品（get_featured_artworks）と購入可能な作品（get_available_artworks）の一覧を、
+-- 該当する行だけを持つ部分インデックスから created_at の降順で取得できるようにする。
+-- find_all は絞り込み条件を is_featured = TRUE / is_sold = FALSE のリテラルで埋め込むため、
+-- プリペアドステートメントでもプランナーがこれらのインデックスを選択できる
+CREATE INDEX IF NOT EXISTS artworks_featured_created_at_idx
+    ON artworks (created_at DESC) WHERE is_featured;
+
+CREATE INDEX IF NOT EXISTS artworks_available_created_at_idx
+    ON artworks (created_at DESC) WHERE NOT is_sold;
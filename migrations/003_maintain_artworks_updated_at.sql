@@ -0,0 +1,21 @@
+-- 作品一覧のキャッシュ（ArtworkService._get_list_entry）は、作品テーブルのバージョン
+-- （ArtworkRepository.get_version: 行数と max(updated_at)）が変わらなければ作品を取得し直さない。
+-- 行を更新しても updated_at が変わらないとバージョンが変わらず古い一覧を返し続けるため、
+-- INSERT / UPDATE のたびにデータベース側で updated_at を設定する。
+-- now() はトランザクション開始時刻を返すため、長いトランザクション内の更新でも
+-- 値が進むよう clock_timestamp() を使用する
+ALTER TABLE artworks
+    ADD COLUMN IF NOT EXISTS updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP;
+
+CREATE OR REPLACE FUNCTION artworks_set_updated_at() RETURNS trigger AS $$
+BEGIN
+    NEW.updated_at := clock_timestamp();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS artworks_set_updated_at ON artworks;
+
+CREATE TRIGGER artworks_set_updated_at
+    BEFORE INSERT OR UPDATE ON artworks
+    FOR EACH ROW EXECUTE FUNCTION artworks_set_updated_at();
@@ -3,11 +3,10 @@
 設定ファイル（config.yaml）から設定を読み込み、アプリケーション全体で使用する設定を提供します。
 機密情報（パスワードなど）は専用の復号APIコンテナから取得します。"""
 
+import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
-
-import requests
-import yaml
+from typing import Any, Optional, Tuple
 
 # 設定ファイルのパス
 CONFIG_FILE = Path("/conf/backend/config/config.yaml")
@@ -15,20 +14,54 @@ CONFIG_FILE = Path("/conf/backend/config/config.yaml")
 # トークンファイルのデフォルトパス（Dockerボリューム経由で secrets-api から提供される）
 TOKEN_FILE = Path("/tokens/backend/backend_token.txt")
 
+# トークンファイルの出現を確認する間隔（秒）
+TOKEN_POLL_INTERVAL = 0.05
 
-def _get_token_from_file(max_retries: int = 5, retry_interval: int = 1, config: dict = None) -> str:
-    """トークンファイルからワンタイムトークンを読み込む（リトライあり）.
+# 最後に取得したパスワード: (API URL, トークンファイル, 使用したトークンファイルの更新時刻, パスワード)
+_password_cache: Optional[Tuple[str, Path, Optional[int], str]] = None
+
+# データベース接続時に libpq へ渡す追加パラメータ。
+# TCP keepalive で切断された接続を早く検出してプールから破棄し、
+# 応答しないクエリや放置されたトランザクションはサーバー側でタイムアウトさせる
+DB_CONNECTION_OPTIONS = {
+    "connect_timeout": 3,
+    "keepalives": 1,
+    "keepalives_idle": 30,
+    "keepalives_interval": 10,
+    "keepalives_count": 3,
+    "application_name": "art-gallery-backend",
+    "options": "-c statement_timeout=5000 -c idle_in_transaction_session_timeout=10000",
+}
+
+
+def _resolve_token_file(config: dict = None) -> Path:
+    """トークンファイルのパスを解決する.
 
     config.yaml の secrets_api.token_file が設定されている場合はそのパスを使用する。
     これによりローカル開発時（バックエンドをホストプロセスで起動する場合）に
     コンテナ外のトークンファイルパスを指定できる。
     """
+    token_file_path = config.get("secrets_api", {}).get("token_file") if config else None
+    return Path(token_file_path) if token_file_path else TOKEN_FILE
+
+
+def _get_token_from_file(
+    max_retries: int = 5, retry_interval: int = 1, token_file: Optional[Path] = None
+) -> str:
+    """トークンファイルからワンタイムトークンを読み込む（リトライあり）.
+
+    待機時間の上限は従来どおり (max_retries - 1) * retry_interval 秒ですが、
+    ファイルの有無は TOKEN_POLL_INTERVAL ごとに確認するため、
+    secrets-api がトークンを書き出した直後に読み込めます。
+    """
     import time
 
-    token_file_path = config.get("secrets_api", {}).get("token_file") if config else None
-    token_file = Path(token_file_path) if token_file_path else TOKEN_FILE
+    token_file = token_file or TOKEN_FILE
+    deadline = time.monotonic() + (max_retries - 1) * retry_interval
+    attempt = 0
 
-    for attempt in range(max_retries):
+    while True:
+        attempt += 1
         if token_file.exists():
             try:
                 token = token_file.read_text().strip()
@@ -36,37 +69,100 @@ def _get_token_from_file(max_retries: int = 5, retry_interval: int = 1, config:
                     return token
             except Exception as e:
                 # print を維持しつつ、エラー時は継続
-                print(f"Error reading token file (attempt {attempt + 1}): {e}")
+                print(f"Error reading token file (attempt {attempt}): {e}")
 
-        if attempt < max_retries - 1:
-            time.sleep(retry_interval)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(TOKEN_POLL_INTERVAL, remaining))
 
     raise RuntimeError(
-        f"トークンファイルが見つかりません: {token_file} ({max_retries}回試行後)\n"
+        f"トークンファイルが見つかりません: {token_file} ({attempt}回試行後)\n"
         "secrets-apiコンテナが正常に起動し、トークンを生成しているか確認してください。"
     )
 
 
+def _token_mtime_ns(token_file: Path) -> Optional[int]:
+    """トークンファイルの更新時刻を返す（ファイルが存在しない場合は None）."""
+    try:
+        return token_file.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_password_from_api(config: dict) -> str:
-    """復号化APIからデータベースパスワードを取得する."""
+    """復号化APIからデータベースパスワードを取得する.
+
+    取得結果は API URL・トークンファイル・トークンファイルの更新時刻とともにキャッシュされます。
+    ワンタイムトークンは使用後に破棄されるため、設定の再読み込み時にトークンファイルが
+    存在しない場合はキャッシュ済みのパスワードを再利用し、新しいトークンが置かれた場合
+    （更新時刻が変わった場合）にのみ API へ問い合わせます。"""
+    global _password_cache
+
     api_config = config.get("secrets_api", {})
     api_url = api_config.get("url", "http://art-gallery-secrets-api:5000")
+    token_file = _resolve_token_file(config)
+    token_mtime_ns = _token_mtime_ns(token_file)
+
+    if _password_cache is not None:
+        cached_url, cached_token_file, cached_mtime_ns, cached_password = _password_cache
+        if (
+            cached_url == api_url
+            and cached_token_file == token_file
+            and token_mtime_ns in (None, cached_mtime_ns)
+        ):
+            return cached_password
+
+    password = _fetch_password(api_url, token_file)
+
+    # 取得後もトークンファイルが残っている場合は、その更新時刻を使用済みとして記録する
+    used_mtime_ns = _token_mtime_ns(token_file)
+    if used_mtime_ns is None:
+        used_mtime_ns = token_mtime_ns
+    _password_cache = (api_url, token_file, used_mtime_ns, password)
+    return password
+
+
+@lru_cache(maxsize=1)
+def _get_http_session() -> Any:
+    """secrets-api 用の HTTP セッションを返す.
+
+    プロセス内で1つのセッションを共有し、設定の再読み込み時にも TCP 接続を keep-alive で再利用します。
+    接続エラーのみリトライし、読み込みエラーはリトライしません（ワンタイムトークンを再送しないため）。"""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=2,
+        max_retries=Retry(total=3, read=0, backoff_factor=0.1),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
 
-    # secrets-api 認証用トークンの取得（config を渡して token_file パスを解決）
-    auth_token = _get_token_from_file(config=config)
+def _fetch_password(api_url: str, token_file: Path) -> str:
+    """復号化APIへ問い合わせてデータベースパスワードを取得する."""
+    import requests
+
+    # secrets-api 認証用トークンの取得
+    auth_token = _get_token_from_file(token_file=token_file)
 
     try:
         headers = {"Authorization": f"Bearer {auth_token}"}
-        response = requests.get(
+        response = _get_http_session().get(
             f"{api_url}/secrets/database/password", headers=headers, timeout=5
         )
         response.raise_for_status()
-        data = response.json()
+        data = json.loads(response.content)
         password = data.get("password")
         if not password:
             raise ValueError("復号APIからパスワードを取得できませんでした。")
         return password
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, json.JSONDecodeError) as e:
         raise RuntimeError(f"復号APIからのパスワード取得に失敗しました: {e}")
 
 
@@ -75,18 +171,28 @@ def _load_config_file() -> dict:
     if not CONFIG_FILE.exists():
         raise FileNotFoundError(f"設定ファイルが見つかりません: {CONFIG_FILE}")
 
+    import yaml
+
+    # libyaml の C 拡張が利用可能であれば高速な CSafeLoader を使用する
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
     try:
         with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=loader) or {}  # nosec B506
             if not config:
                 raise ValueError(f"{CONFIG_FILE} が空です。")
-            return config
     except Exception as e:
         raise RuntimeError(f"設定ファイルの読み込みに失敗しました: {e}")
 
+    return config
+
 
+@lru_cache(maxsize=1)
 def _load_config() -> dict:
-    """全設定（ファイル + API経由の秘密情報）をロードする."""
+    """全設定（ファイル + API経由の秘密情報）をロードする.
+
+    結果はプロセス内でキャッシュされ、YAML の解析と復号APIへの問い合わせは一度だけ行われます。
+    再読み込みする場合は ``_load_config.cache_clear()`` を呼び出してください。"""
     # 1. config.yaml を読み込む
     config = _load_config_file()
 
@@ -98,7 +204,7 @@ def _load_config() -> dict:
     config["database"]["password"] = db_password
 
     # 3. 必須項目の検証
-    required_keys = ["server", "database", "secrets_api"]
+    required_keys = ["server", "database", "secrets_api", "frontend"]
     for key in required_keys:
         if key not in config:
             raise ValueError(f"config.yamlに必須項目 '{key}' がありません。")
@@ -109,73 +215,116 @@ def _load_config() -> dict:
 class MyProperties:
     """アプリケーション設定クラス.
 
-    シングルトン的に一度だけ設定をロードし、プロパティ経由で型安全なアクセスを提供します。"""
+    シングルトン的に一度だけ設定をロードし、プロパティ経由で型安全なアクセスを提供します。
+    各設定値はロード時に一度だけ解決してクラス属性に保持するため、
+    アクセスのたびに設定辞書を辿ることはありません。"""
 
-    _config: dict = {}
+    _loaded: bool = False
+    _port: int
+    _flask_env: str
+    _debug: bool
+    _frontend_url: str
+    _db_config: dict
+    _db_pool_min: int
+    _db_pool_max: int
+    _secrets_api_url: str
 
     @classmethod
-    def _get_config(cls) -> dict:
-        """設定をロードして返す（未ロードの場合はロードする）."""
-        if not cls._config:
-            cls._config = _load_config()
-        return cls._config
+    def _ensure_loaded(cls) -> None:
+        """設定が未ロードであればロードする."""
+        if not cls._loaded:
+            cls.load_app_config()
 
     @classmethod
     def load_app_config(cls) -> None:
-        """アプリケーション起動時に設定を明示的に読み込む."""
-        cls._config = _load_config()
+        """アプリケーション起動時に設定を明示的に読み込む.
 
-    @classmethod
-    def get_db_config(cls) -> dict:
-        """データベース接続設定を辞書形式で返す."""
-        config = cls._get_config()
+        設定ファイルの解析と復号APIへの問い合わせはプロセス内で一度だけ行い、2回目以降は
+        キャッシュ済みの設定をクラス属性に反映します。設定ファイルを読み直す場合は
+        ``_load_config.cache_clear()`` を呼び出してから本メソッドを呼び出してください。"""
+        config = _load_config()
+
+        server = config["server"]
         db = config["database"]
-        return {
+        cls._port = server["port"]
+        cls._flask_env = server["flask_env"]
+        cls._debug = server.get("debug", server["flask_env"] == "development")
+        cls._frontend_url = config["frontend"]["url"]
+        cls._db_config = {
             "host": db["host"],
             "port": db["port"],
             "database": db["name"],
             "user": db["user"],
             "password": db["password"],
+            **DB_CONNECTION_OPTIONS,
         }
+        cls._db_pool_min = db.get("pool_min", 2)
+        cls._db_pool_max = db.get("pool_max", 10)
+        cls._secrets_api_url = config["secrets_api"]["url"]
+        cls._loaded = True
+
+    @classmethod
+    def get_db_config(cls) -> dict:
+        """データベース接続設定を辞書形式で返す（psycopg2.connect にそのまま渡せる）."""
+        cls._ensure_loaded()
+        return dict(cls._db_config)
 
     @classmethod
     def PORT(self) -> int:
-        return self._get_config()["server"]["port"]
+        self._ensure_loaded()
+        return self._port
 
     @classmethod
     def FLASK_ENV(self) -> str:
-        return self._get_config()["server"]["flask_env"]
+        self._ensure_loaded()
+        return self._flask_env
 
     @classmethod
     def DEBUG(self) -> bool:
-        config = self._get_config()
-        server = config["server"]
-        return server.get("debug", server["flask_env"] == "development")
+        self._ensure_loaded()
+        return self._debug
 
     @classmethod
     def FRONTEND_URL(self) -> str:
-        return self._get_config()["frontend"]["url"]
+        self._ensure_loaded()
+        return self._frontend_url
 
     @classmethod
     def DB_HOST(self) -> str:
-        return self._get_config()["database"]["host"]
+        self._ensure_loaded()
+        return self._db_config["host"]
 
     @classmethod
     def DB_PORT(self) -> int:
-        return self._get_config()["database"]["port"]
+        self._ensure_loaded()
+        return self._db_config["port"]
 
     @classmethod
     def DB_NAME(self) -> str:
-        return self._get_config()["database"]["name"]
+        self._ensure_loaded()
+        return self._db_config["database"]
 
     @classmethod
     def DB_USER(self) -> str:
-        return self._get_config()["database"]["user"]
+        self._ensure_loaded()
+        return self._db_config["user"]
 
     @classmethod
     def DB_PASSWORD(self) -> str:
-        return self._get_config()["database"]["password"]
+        self._ensure_loaded()
+        return self._db_config["password"]
+
+    @classmethod
+    def DB_POOL_MIN(self) -> int:
+        self._ensure_loaded()
+        return self._db_pool_min
+
+    @classmethod
+    def DB_POOL_MAX(self) -> int:
+        self._ensure_loaded()
+        return self._db_pool_max
 
     @classmethod
     def SECRETS_API_URL(self) -> str:
-        return self._get_config()["secrets_api"]["url"]
+        self._ensure_loaded()
+        return self._secrets_api_url
@@ -3,12 +3,148 @@
 作品エンティティの永続化を担当します。
 リポジトリパターンにより、データアクセスの詳細をドメイン層から分離します。"""
 
-from typing import List, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from domain.artwork import Artwork
-from psycopg2.extras import RealDictCursor
+from psycopg2.extensions import cursor as TupleCursor
+from psycopg2.extras import execute_values
 from repositories.database import Database
 
+# Artwork のフィールド順に並べた列。タプルの行をそのまま Artwork.from_row に渡せるようにする
+_ARTWORK_COLUMNS = (
+    "id, title, description, image_url, price, size, medium, year,"
+    " is_featured, is_sold, created_at, updated_at"
+)
+
+# bulk_insert で登録する列（id と作成・更新日時はデータベースの既定値を使用する）
+_INSERT_COLUMNS = (
+    "title", "description", "image_url", "price", "size", "medium", "year",
+    "is_featured", "is_sold",
+)
+
+# find_all が一度に返す作品数の既定値と上限（API の limit クエリパラメータもこの範囲で受け付ける）
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+# bulk_insert で1回の INSERT 文にまとめる行数
+BULK_INSERT_PAGE_SIZE = 500
+
+
+def _build_find_all_statement(featured: Optional[bool], sold: Optional[bool]) -> str:
+    """find_all のプリペアドステートメントを組み立てる.
+
+    絞り込み条件はリテラル（TRUE/FALSE）として埋め込み、LIMIT と OFFSET のみを
+    パラメータ（$1, $2）とします。
+
+    Args:
+        featured: おすすめ作品の絞り込み条件（Noneの場合は絞り込まない）
+        sold: 販売済みの絞り込み条件（Noneの場合は絞り込まない）
+
+    Returns:
+        SQL 文字列"""
+    conditions = [
+        f"{column} = {'TRUE' if value else 'FALSE'}"
+        for column, value in (("is_featured", featured), ("is_sold", sold))
+        if value is not None
+    ]
+    where = " WHERE " + " AND ".join(conditions) if conditions else ""
+    return (
+        f"SELECT {_ARTWORK_COLUMNS} FROM artworks{where}"
+        " ORDER BY created_at DESC LIMIT $1 OFFSET $2"
+    )
+
+
+# find_all のプリペアドステートメント（起動時に全パターンを生成しておく）
+# キーは (featured, sold)、値は (ステートメント名, SQL)
+_FILTER_NAME_SUFFIXES = {None: "", True: "_{}", False: "_not_{}"}
+_FIND_ALL_STATEMENTS = {
+    (featured, sold): (
+        "artworks_find_all"
+        + _FILTER_NAME_SUFFIXES[featured].format("featured")
+        + _FILTER_NAME_SUFFIXES[sold].format("sold"),
+        _build_find_all_statement(featured, sold),
+    )
+    for featured in (None, True, False)
+    for sold in (None, True, False)
+}
+
+# プリペアドステートメントは接続（セッション）が生きている間保持されるため、
+# SELECT * は使わずに列を明示する（列の追加後に「cached plan must not change result type」となるのを防ぐ）
+_FIND_BY_ID_STATEMENT = (
+    "artworks_find_by_id",
+    f"SELECT {_ARTWORK_COLUMNS} FROM artworks WHERE id = $1",
+)
+_FIND_BY_IDS_STATEMENT = (
+    "artworks_find_by_ids",
+    f"SELECT {_ARTWORK_COLUMNS} FROM artworks WHERE id = ANY($1)",
+)
+_BULK_INSERT_STATEMENT = (
+    f"INSERT INTO artworks ({', '.join(_INSERT_COLUMNS)}) VALUES %s RETURNING id"
+)
+_FIND_TITLE_BY_ID_STATEMENT = (
+    "artworks_find_title_by_id",
+    "SELECT title FROM artworks WHERE id = $1",
+)
+_FIND_TITLES_BY_IDS_STATEMENT = (
+    "artworks_find_titles_by_ids",
+    "SELECT id, title FROM artworks WHERE id = ANY($1)",
+)
+# 作品の追加・更新・削除で変化する値（件数と最終更新日時）のハッシュ
+# （updated_at は migrations/003 のトリガーが INSERT / UPDATE のたびに設定する）
+_GET_VERSION_STATEMENT = (
+    "artworks_get_version",
+    "SELECT md5(count(*)::text || ':' || coalesce(max(updated_at)::text, '')) FROM artworks",
+)
+
+
+class _TitleCache:
+    """作品タイトルの TTL 付き LRU キャッシュ（スレッドセーフ）.
+
+    タイトルはほとんど変更されないため、一定時間は DB に問い合わせずに返します。"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, artwork_id: int) -> Optional[str]:
+        """有効期限内のタイトルを返す（存在しない場合はNone）."""
+        with self._lock:
+            entry = self._entries.get(artwork_id)
+            if entry is None:
+                return None
+            expires_at, title = entry
+            if expires_at <= time.monotonic():
+                del self._entries[artwork_id]
+                return None
+            self._entries.move_to_end(artwork_id)
+            return title
+
+    def set(self, artwork_id: int, title: str) -> None:
+        """タイトルを保存し、上限を超えた場合は最も古いものから破棄する."""
+        with self._lock:
+            self._entries[artwork_id] = (time.monotonic() + self._ttl, title)
+            self._entries.move_to_end(artwork_id)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, artwork_id: int) -> None:
+        """タイトルをキャッシュから削除する."""
+        with self._lock:
+            self._entries.pop(artwork_id, None)
+
+    def clear(self) -> None:
+        """キャッシュを空にする."""
+        with self._lock:
+            self._entries.clear()
+
+
+_title_cache = _TitleCache(maxsize=2048, ttl=60)
+
 
 class ArtworkRepository:
     """作品リポジトリクラス.
@@ -18,33 +154,29 @@ class ArtworkRepository:
 
     @staticmethod
     def find_all(
-        featured: Optional[bool] = None, sold: Optional[bool] = None
+        featured: Optional[bool] = None,
+        sold: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
     ) -> List[Artwork]:
-        """すべての作品を取得.
+        """作品を新しい順に取得.
 
         Args:
             featured: おすすめ作品でフィルタリング（Noneの場合はフィルタリングしない）
             sold: 販売済みでフィルタリング（Noneの場合はフィルタリングしない）
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
 
         Returns:
             作品エンティティのリスト"""
-        query = "SELECT * FROM artworks WHERE 1=1"
-        params = []
-
-        if featured is not None:
-            query += " AND is_featured = %s"
-            params.append(featured)
-
-        if sold is not None:
-            query += " AND is_sold = %s"
-            params.append(sold)
-
-        query += " ORDER BY created_at DESC"
+        name, statement = _FIND_ALL_STATEMENTS[(featured, sold)]
 
-        with Database.get_cursor(RealDictCursor) as cursor:
-            cursor.execute(query, params)
-            results = cursor.fetchall()
-            return [Artwork.from_dict(dict(row)) for row in results]
+        # 行ごとの辞書を作らずに済むよう、タプルを返すカーソルで取得する。
+        # 常に LIMIT を付けて問い合わせるため、fetchall で受け取る行数は limit 件以下に収まる
+        # （サービス層は MAX_PAGE_SIZE + 1 件までしか要求しない）。サーバーサイドカーソルは使用しない
+        with Database.get_cursor(TupleCursor) as cursor:
+            Database.execute_prepared(cursor, name, statement, (limit, offset))
+            return Artwork.from_rows(cursor.fetchall())
 
     @staticmethod
     def find_by_id(artwork_id: int) -> Optional[Artwork]:
@@ -55,28 +187,135 @@ class ArtworkRepository:
 
         Returns:
             見つかった場合はArtworkエンティティ、見つからない場合はNone"""
-        with Database.get_cursor(RealDictCursor) as cursor:
-            cursor.execute("SELECT * FROM artworks WHERE id = %s", (artwork_id,))
+        with Database.get_cursor(TupleCursor) as cursor:
+            Database.execute_prepared(cursor, *_FIND_BY_ID_STATEMENT, (artwork_id,))
             result = cursor.fetchone()
 
             if result:
-                return Artwork.from_dict(dict(result))
+                return Artwork.from_row(result)
             return None
 
+    @staticmethod
+    def find_by_ids(artwork_ids: Iterable[int]) -> List[Artwork]:
+        """複数のIDの作品を1回のクエリでまとめて取得.
+
+        Args:
+            artwork_ids: 作品IDのリスト
+
+        Returns:
+            見つかった作品エンティティのリスト（順序は不定）"""
+        ids = list(dict.fromkeys(artwork_ids))
+        if not ids:
+            return []
+
+        with Database.get_cursor(TupleCursor) as cursor:
+            Database.execute_prepared(cursor, *_FIND_BY_IDS_STATEMENT, (ids,))
+            return Artwork.from_rows(cursor.fetchall())
+
     @staticmethod
     def find_title_by_id(artwork_id: int) -> Optional[str]:
         """作品IDからタイトルのみを取得（軽量なクエリ）.
 
+        取得したタイトルは一定時間キャッシュされます。
+
         Args:
             artwork_id: 作品ID
 
         Returns:
             作品タイトル、見つからない場合はNone"""
+        cached = _title_cache.get(artwork_id)
+        if cached is not None:
+            return cached
+
         with Database.get_cursor() as cursor:
-            cursor.execute("SELECT title FROM artworks WHERE id = %s", (artwork_id,))
+            Database.execute_prepared(cursor, *_FIND_TITLE_BY_ID_STATEMENT, (artwork_id,))
             result = cursor.fetchone()
 
-            if result:
-                title = result[0]
-                return str(title) if title is not None else None
-            return None
+        if result and result["title"] is not None:
+            title = str(result["title"])
+            _title_cache.set(artwork_id, title)
+            return title
+        return None
+
+    @staticmethod
+    def find_titles_by_ids(artwork_ids: Iterable[int]) -> Dict[int, str]:
+        """複数の作品IDのタイトルを1回のクエリでまとめて取得.
+
+        キャッシュ済みのタイトルはそのまま使用し、残りのIDのみを問い合わせます。
+
+        Args:
+            artwork_ids: 作品IDのリスト
+
+        Returns:
+            作品IDをキー、タイトルを値とする辞書（見つからないIDは含まない）"""
+        titles: Dict[int, str] = {}
+        missing_ids = []
+        for artwork_id in dict.fromkeys(artwork_ids):
+            cached = _title_cache.get(artwork_id)
+            if cached is not None:
+                titles[artwork_id] = cached
+            else:
+                missing_ids.append(artwork_id)
+
+        if not missing_ids:
+            return titles
+
+        with Database.get_cursor(TupleCursor) as cursor:
+            Database.execute_prepared(cursor, *_FIND_TITLES_BY_IDS_STATEMENT, (missing_ids,))
+            results = cursor.fetchall()
+
+        for artwork_id, title in results:
+            if title is not None:
+                titles[artwork_id] = str(title)
+                _title_cache.set(artwork_id, titles[artwork_id])
+        return titles
+
+    @staticmethod
+    def bulk_insert(artworks: Iterable[Artwork]) -> List[int]:
+        """複数の作品をまとめて登録.
+
+        BULK_INSERT_PAGE_SIZE 行ごとに1つの INSERT 文にまとめるため、
+        1行ずつ登録する場合と比べてデータベースとの往復回数が少なくなります。
+
+        Args:
+            artworks: 登録する作品エンティティ（id と作成・更新日時は無視される）
+
+        Returns:
+            登録した作品のIDのリスト"""
+        rows = [
+            tuple(getattr(artwork, column) for column in _INSERT_COLUMNS)
+            for artwork in artworks
+        ]
+        if not rows:
+            return []
+
+        with Database.get_cursor(TupleCursor) as cursor:
+            results = execute_values(
+                cursor,
+                _BULK_INSERT_STATEMENT,
+                rows,
+                page_size=BULK_INSERT_PAGE_SIZE,
+                fetch=True,
+            )
+            return [row[0] for row in results]
+
+    @staticmethod
+    def get_version() -> str:
+        """作品テーブルのバージョンを取得（集計クエリのみで、作品の行は取得しない）.
+
+        作品の件数または最終更新日時が変わると値が変わるため、
+        一覧のキャッシュや ETag の検証に使用します。
+
+        Returns:
+            作品テーブルのバージョンを表す文字列"""
+        with Database.get_cursor(TupleCursor) as cursor:
+            Database.execute_prepared(cursor, *_GET_VERSION_STATEMENT)
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def invalidate_title(artwork_id: int) -> None:
+        """キャッシュ済みのタイトルを破棄する（作品を更新・削除した際に呼び出す）.
+
+        Args:
+            artwork_id: 作品ID"""
+        _title_cache.pop(artwork_id)
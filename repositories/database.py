@@ -1,14 +1,21 @@
+import atexit
+import threading
 import time
 from contextlib import contextmanager
-from typing import Generator, Any, Optional
+from typing import Generator, Any, Optional, Sequence, Union
 from enum import Enum
 import dataclasses
 
 import psycopg2
+from psycopg2 import pool, sql
 from psycopg2.extras import RealDictCursor
 from my_properties import MyProperties
 
 
+# プールの接続がすべて貸し出されている場合に、空き接続を待つ最大時間（秒）
+POOL_ACQUIRE_TIMEOUT = 1.0
+
+
 # 接続試行の結果タイプを定義するEnum
 class ConnectionResultType(Enum):
     SUCCESS = "success"
@@ -16,30 +23,79 @@ class ConnectionResultType(Enum):
     FATAL_FAILURE = "fatal_failure"
 
 # 接続試行の具体的な結果を格納するデータクラス
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class ConnectionAttemptResult:
     type: ConnectionResultType
     connection: Optional[psycopg2.extensions.connection] = None  # 成功時のみ
     exception: Optional[Exception] = None # 失敗時のみ
 
+class PooledConnection(psycopg2.extensions.connection):
+    """プール内で再利用される接続.
+
+    セッション中に PREPARE 済みのステートメント名を保持し、同じ接続での再準備を避けます。"""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared_statements: set = set()
+
+class BoundedConnectionPool(pool.ThreadedConnectionPool):
+    """空き接続を一定時間待つ ThreadedConnectionPool.
+
+    ThreadedConnectionPool は貸し出し中の接続が maxconn に達すると即座に PoolError を送出するため、
+    セマフォで貸し出し数を制限し、他のスレッドが接続を返却するまで acquire_timeout 秒まで待機します。"""
+    def __init__(
+        self,
+        minconn: int,
+        maxconn: int,
+        *args,
+        acquire_timeout: float = POOL_ACQUIRE_TIMEOUT,
+        **kwargs,
+    ):
+        super().__init__(minconn, maxconn, *args, **kwargs)
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._acquire_timeout = acquire_timeout
+
+    def getconn(self, key=None) -> psycopg2.extensions.connection:
+        if not self._slots.acquire(timeout=self._acquire_timeout):
+            raise pool.PoolError(
+                f"connection pool exhausted: {self._acquire_timeout} 秒待機しても空き接続がありません"
+            )
+        try:
+            return super().getconn(key)
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn=None, key=None, close=False) -> None:
+        super().putconn(conn, key, close)
+        self._slots.release()
+
 class ManagedConnection:
-    """psycopg2の接続オブジェクトをラップし、トランザクション管理と自動クローズを行うコンテキストマネージャ."""
-    def __init__(self, conn: psycopg2.extensions.connection):
+    """プールから借りた接続をラップし、トランザクション管理とプールへの返却を行うコンテキストマネージャ."""
+    def __init__(
+        self, conn: psycopg2.extensions.connection, connection_pool: pool.AbstractConnectionPool
+    ):
         self._conn = conn
+        self._pool = connection_pool
 
     def __enter__(self) -> psycopg2.extensions.connection:
         return self._conn
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> bool:
-        if exc_type is None:
-            # 例外がなければコミット
-            self._conn.commit()
-        else:
-            # 例外があればロールバック
-            self._conn.rollback()
-        
-        # 接続を閉じる
-        self._conn.close()
+        discard = False
+        try:
+            if exc_type is None:
+                # 例外がなければコミット
+                self._conn.commit()
+            else:
+                # 例外があればロールバック
+                self._conn.rollback()
+        except psycopg2.Error:
+            # コミット・ロールバックに失敗した接続は状態が分からないため再利用しない
+            discard = True
+            raise
+        finally:
+            # 接続を閉じずにプールへ返却する（切断済みの接続は再利用せずに破棄し、次回プールが新しく接続する）
+            self._pool.putconn(self._conn, close=discard or bool(self._conn.closed))
         
         # 例外を再スローするために False を返す
         return False 
@@ -47,18 +103,59 @@ class ManagedConnection:
 class Database:
     """データベース接続管理クラス.
 
-    シングルトンパターン的なアプローチで、データベース接続を管理します。
-    コンテキストマネージャーを使用することで、接続の確実なクローズを保証します。"""
+    プロセス内で共有するコネクションプール（BoundedConnectionPool）から接続を貸し出します。
+    コンテキストマネージャーを使用することで、接続の確実なプールへの返却を保証します。"""
+
+    # 初回の接続要求時に作成されるコネクションプール。
+    # 遅延生成のため、gunicorn の --preload でも fork 後の各ワーカーがそれぞれのプールを持つ
+    _pool: Optional[BoundedConnectionPool] = None
+    _pool_lock = threading.Lock()
+
+    @classmethod
+    def _get_pool(cls) -> BoundedConnectionPool:
+        """コネクションプールを返す（未作成の場合は作成する）."""
+        connection_pool = cls._pool
+        if connection_pool is None:
+            with cls._pool_lock:
+                if cls._pool is None:
+                    # pool_min 本の接続はプールに保持され、それを超えた分は返却時に閉じられる
+                    cls._pool = BoundedConnectionPool(
+                        MyProperties.DB_POOL_MIN(),
+                        MyProperties.DB_POOL_MAX(),
+                        connection_factory=PooledConnection,
+                        **MyProperties.get_db_config(),
+                    )
+                    atexit.register(cls.close_pool)
+                connection_pool = cls._pool
+        return connection_pool
+
+    @classmethod
+    def close_pool(cls) -> None:
+        """コネクションプールのすべての接続を閉じる（プロセス終了時に自動で呼び出される）."""
+        with cls._pool_lock:
+            if cls._pool is not None and not cls._pool.closed:
+                cls._pool.closeall()
+            cls._pool = None
 
     @classmethod
     def _try_get_single_connection(cls) -> ConnectionAttemptResult:
-        """一度のデータベース接続試行を行い、結果を ConnectionAttemptResult で返す."""
+        """プールから一度だけ接続の取得を試み、結果を ConnectionAttemptResult で返す."""
         try:
-            conn = psycopg2.connect(**MyProperties.get_db_config())
+            conn = cls._get_pool().getconn()
             return ConnectionAttemptResult(type=ConnectionResultType.SUCCESS, connection=conn)
+        except pool.PoolError as e:
+            # プールの枯渇（空き接続の待機がタイムアウトした場合）はデータベースの起動待ちとは異なり、
+            # 指数バックオフで待っても応答が遅れるだけのため、リトライせずにエラーとする
+            return ConnectionAttemptResult(type=ConnectionResultType.FATAL_FAILURE, exception=e)
         except psycopg2.OperationalError as e:
             # リトライ対象のOperationalErrorかどうかをチェック
-            if "could not translate host name" in str(e) or "Is the server running" in str(e):
+            # （connect_timeout を超えた場合も、データベースの起動待ちとしてリトライする）
+            message = str(e)
+            if (
+                "could not translate host name" in message
+                or "Is the server running" in message
+                or "timeout expired" in message
+            ):
                 return ConnectionAttemptResult(type=ConnectionResultType.RETRYABLE_FAILURE, exception=e)
             else:
                 return ConnectionAttemptResult(type=ConnectionResultType.FATAL_FAILURE, exception=e)
@@ -89,7 +186,7 @@ class Database:
             match result.type:
                 case ConnectionResultType.SUCCESS:
                     # 接続成功。ManagedConnectionのインスタンスをyieldする
-                    with ManagedConnection(result.connection) as conn:
+                    with ManagedConnection(result.connection, Database._get_pool()) as conn:
                         yield conn
                     return # ManagedConnection.__exit__ 処理後、コンテキストを抜ける
 
@@ -136,3 +233,39 @@ class Database:
                 yield cursor
             finally:
                 cursor.close()
+
+    @staticmethod
+    def execute_prepared(
+        cursor: psycopg2.extensions.cursor,
+        name: str,
+        statement: Union[str, sql.Composable],
+        params: Sequence[Any] = (),
+    ) -> None:
+        """プリペアドステートメントを実行する.
+
+        PREPARE は接続（セッション）ごとに初回のみ行い、以降は EXECUTE だけを送信するため、
+        PostgreSQL 側での SQL の解析と実行計画の作成が省略されます。
+
+        Usage:
+            with Database.get_cursor() as cursor:
+                Database.execute_prepared(
+                    cursor, "artworks_find_by_id", "SELECT * FROM artworks WHERE id = $1", (1,)
+                )
+                result = cursor.fetchone()
+
+        Args:
+            cursor: Database.get_cursor() で取得したカーソル
+            name: ステートメント名
+            statement: $1, $2, ... をプレースホルダーとする SQL（文字列または psycopg2.sql の合成オブジェクト）
+            params: プレースホルダーに渡すパラメータ"""
+        prepared = cursor.connection.prepared_statements
+        if name not in prepared:
+            if isinstance(statement, str):
+                statement = sql.SQL(statement)
+            cursor.execute(sql.SQL("PREPARE {} AS {}").format(sql.Identifier(name), statement))
+            prepared.add(name)
+
+        execute = sql.SQL("EXECUTE {}").format(sql.Identifier(name))
+        if params:
+            execute += sql.SQL(" ({})").format(sql.SQL(", ").join(sql.Placeholder() * len(params)))
+        cursor.execute(execute, params or None)
@@ -2,9 +2,36 @@
 ルーティングパッケージ.
 
 各機能ごとのブループリントをまとめ、外部から利用しやすくします。
+ブループリントのモジュール（およびサービス・リポジトリ）は register() または
+属性へのアクセス時に初めてインポートされます。
 """
 
-from .artwork_routes import artwork_bp
-from .health import health_bp
+from importlib import import_module
+from typing import Any
 
-__all__ = ["artwork_bp", "health_bp"]
+from flask import Flask
+
+# 公開するブループリント名と、それを定義しているモジュール
+_BLUEPRINT_MODULES = {
+    "health_bp": ".health",
+    "artwork_bp": ".artwork_routes",
+}
+
+__all__ = ["artwork_bp", "health_bp", "register"]
+
+
+def __getattr__(name: str) -> Any:
+    """ブループリントを初回アクセス時にインポートする（PEP 562）."""
+    module_name = _BLUEPRINT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module_name, __name__), name)
+
+
+def register(app: Flask) -> None:
+    """すべてのブループリントをアプリケーションに登録する.
+
+    Args:
+        app: Flaskアプリケーションインスタンス"""
+    for name in _BLUEPRINT_MODULES:
+        app.register_blueprint(__getattr__(name))
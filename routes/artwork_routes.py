@@ -2,46 +2,156 @@
 
 作品に関するHTTPエンドポイントを定義します。"""
 
-from flask import Blueprint, current_app, jsonify, request
-from services.artwork_service import ArtworkService
+from typing import Optional
+
+from flask import Blueprint, Response, current_app, jsonify, request, url_for
+from services.artwork_service import (
+    DEFAULT_PAGE_SIZE,
+    ArtworkService,
+    encode_artworks,
+)
 
 artwork_bp = Blueprint("artworks", __name__, url_prefix="/api/artworks")
 
+# 成功レスポンスをブラウザやリバースプロキシ（nginx）に再利用させる期間（秒）
+ARTWORK_LIST_MAX_AGE = 60
+ARTWORK_DETAIL_MAX_AGE = 300
+
+# 真偽値として受け付けるクエリパラメータの値（小文字）
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+_FALSY = frozenset({"false", "0", "no", "off"})
+
+
+def _parse_bool(value: Optional[str]) -> Optional[bool]:
+    """クエリパラメータの値を真偽値に変換する.
+
+    Args:
+        value: クエリパラメータの値
+
+    Returns:
+        True/False、未指定または解釈できない値の場合はNone（絞り込まない）"""
+    if value is None:
+        return None
+    value = value.lower()
+    if value in _TRUTHY:
+        return True
+    if value in _FALSY:
+        return False
+    return None
+
+
+def _parse_int(name: str, default: int) -> int:
+    """整数のクエリパラメータを取得する.
+
+    Args:
+        name: クエリパラメータ名
+        default: 未指定の場合の値
+
+    Returns:
+        クエリパラメータの値
+
+    Raises:
+        ValueError: 整数として解釈できない場合"""
+    value = request.args.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} は整数で指定してください") from None
+
+
+def _json_response(body: bytes, max_age: int) -> Response:
+    """シリアライズ済みの JSON からレスポンスを作成する.
+
+    Args:
+        body: JSON のバイト列
+        max_age: Cache-Control の max-age（秒）"""
+    response = Response(body, mimetype="application/json")
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response
+
 
 @artwork_bp.route("", methods=["GET"])
 def get_artworks():
-    """作品一覧を取得.
+    """作品一覧を新しい順に1ページ分取得.
 
     クエリパラメータ:
-        featured: true/false - おすすめ作品でフィルタリング
-        sold: true/false - 販売済みでフィルタリング
+        featured: true/false（1/0, yes/no, on/off も可） - おすすめ作品でフィルタリング
+        sold: true/false（1/0, yes/no, on/off も可） - 販売済みでフィルタリング
+        limit: 1ページの件数（1〜MAX_PAGE_SIZE、既定は DEFAULT_PAGE_SIZE）
+        offset: 読み飛ばす件数（既定は 0）
 
     Returns:
-        JSON形式の作品リスト"""
+        JSON形式の作品リスト（If-None-Match が一致する場合は 304 Not Modified）。
+        次のページがある場合は Link ヘッダー（rel="next"）にその URL を設定する。
+        limit・offset が不正な場合は 400 Bad Request"""
     try:
         # クエリパラメータの取得と変換
-        featured_param = request.args.get("featured")
-        sold_param = request.args.get("sold")
+        featured = _parse_bool(request.args.get("featured"))
+        sold = _parse_bool(request.args.get("sold"))
+        limit = _parse_int("limit", DEFAULT_PAGE_SIZE)
+        offset = _parse_int("offset", 0)
 
-        featured = None
-        if featured_param is not None:
-            featured = featured_param.lower() == "true"
+        # サービス層を呼び出し（ETag とシリアライズ済みの JSON を同じキャッシュエントリから取得する）
+        etag, body, has_more = current_app.artwork_service_provider().get_artwork_list(
+            featured=featured, sold=sold, limit=limit, offset=offset
+        )
 
-        sold = None
-        if sold_param is not None:
-            sold = sold_param.lower() == "true"
+        # クライアントが保持している一覧が最新であれば、本文を返さずに 304 を返す
+        if request.if_none_match.contains_weak(etag):
+            response = _json_response(b"", ARTWORK_LIST_MAX_AGE)
+            response.status_code = 304
+        else:
+            response = _json_response(body, ARTWORK_LIST_MAX_AGE)
 
-        # サービス層を呼び出し
-        artworks = current_app.artwork_service.get_all_artworks(
-            featured=featured, sold=sold
+        response.set_etag(etag, weak=True)
+        if has_more:
+            query = {**request.args.to_dict(), "limit": limit, "offset": offset + limit}
+            next_url = url_for("artworks.get_artworks", **query)
+            response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return response
+    except ValueError as e:
+        # limit・offset が整数でない、または範囲外の場合
+        return jsonify({"error": str(e)}), 400
+    except Exception as e:
+        # トレースバックを含めてエラーログを出力
+        current_app.logger.error(
+            f"作品一覧取得中にエラーが発生しました: {e}", exc_info=True
         )
+        return jsonify({"error": str(e)}), 500
+
+
+@artwork_bp.route("/overview", methods=["GET"])
+def get_artworks_overview():
+    """おすすめ作品と購入可能な作品の一覧（それぞれ先頭の1ページ）をまとめて取得.
 
-        # エンティティを辞書に変換
-        return jsonify([artwork.to_dict() for artwork in artworks])
+    2つの一覧は通常キャッシュ済みの JSON を連結するだけのため、スレッドプールを使わずに順に取得します。
+
+    Returns:
+        JSON形式の {"featured": 作品リスト, "available": 作品リスト}
+        （If-None-Match が一致する場合は 304 Not Modified）"""
+    try:
+        service = current_app.artwork_service_provider()
+        featured_etag, featured, _ = service.get_artwork_list(featured=True)
+        available_etag, available, _ = service.get_artwork_list(sold=False)
+        etag = f"{featured_etag}:{available_etag}"
+
+        # クライアントが保持している一覧が最新であれば、本文を返さずに 304 を返す
+        if request.if_none_match.contains_weak(etag):
+            response = _json_response(b"", ARTWORK_LIST_MAX_AGE)
+            response.status_code = 304
+        else:
+            body = b'{"featured":' + featured + b',"available":' + available + b"}"
+            response = _json_response(body, ARTWORK_LIST_MAX_AGE)
+
+        response.set_etag(etag, weak=True)
+        return response
     except Exception as e:
         # トレースバックを含めてエラーログを出力
         current_app.logger.error(
-            f"作品一覧取得中にエラーが発生しました: {e}", exc_info=True
+            f"作品の概要取得中にエラーが発生しました: {e}", exc_info=True
         )
         return jsonify({"error": str(e)}), 500
 
@@ -56,10 +166,10 @@ def get_artwork(artwork_id: int):
     Returns:
         JSON形式の作品情報"""
     try:
-        artwork = current_app.artwork_service.get_artwork_by_id(artwork_id)
+        artwork = current_app.artwork_service_provider().get_artwork_by_id(artwork_id)
         if artwork is None:
             return jsonify({"error": f"作品ID {artwork_id} が見つかりません"}), 404
-        return jsonify(artwork.to_dict())
+        return _json_response(encode_artworks(artwork), ARTWORK_DETAIL_MAX_AGE)
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
     except Exception as e:
@@ -3,10 +3,55 @@
 作品に関するビジネスロジックを実装します。
 リポジトリを利用してデータアクセスを行い、ドメインロジックを実行します。"""
 
-from typing import List, Optional
+import json
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from domain.artwork import Artwork
-from repositories.artwork_repository import ArtworkRepository
+from repositories.artwork_repository import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, ArtworkRepository
+
+try:
+    import orjson
+except ImportError:  # orjson がインストールされていない環境では標準ライブラリの json を使用する
+    orjson = None
+
+# 作品一覧の JSON キャッシュの有効期間（秒）
+ARTWORK_LIST_CACHE_TTL = 60
+
+# 作品一覧の JSON キャッシュに保持するページ数の上限
+ARTWORK_LIST_CACHE_MAX_ENTRIES = 256
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson（または json）が直接変換できない値を JSON 互換の値に変換する.
+
+    Artwork は dataclass のフィールドをそのまま出力せず、Artwork.to_json_dict() で
+    公開するフィールドと価格の形式を決めます。日時は orjson が直接出力するため、
+    isoformat() に変換するのは標準ライブラリの json を使用する場合だけです。"""
+    if isinstance(obj, Artwork):
+        return obj.to_json_dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def encode_artworks(payload: Any) -> bytes:
+    """作品エンティティ（またはそのリスト）を JSON にシリアライズする.
+
+    Args:
+        payload: Artwork またはそのリスト
+
+    Returns:
+        Artwork.to_dict() と同じ形式の JSON のバイト列"""
+    if orjson is None:
+        # orjson と同じく、区切りの空白を入れず非 ASCII 文字をエスケープせずに出力する
+        return json.dumps(
+            payload, default=_json_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+    # dataclass を orjson に直接変換させず、_json_default（Artwork.to_json_dict()）に渡す
+    return orjson.dumps(payload, default=_json_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
 
 
 class ArtworkService:
@@ -24,18 +69,128 @@ class ArtworkService:
                       依存性注入により、テスト時にモックを注入可能"""
         self.repository = repository or ArtworkRepository()
 
+        # 作品一覧の JSON キャッシュ。キーは (featured, sold, limit, offset, キャッシュ世代)、
+        # 値は (有効期限, ETag, JSON, 次のページがあるか)
+        self._json_cache: Dict[
+            Tuple[Optional[bool], Optional[bool], int, int, int], Tuple[float, str, bytes, bool]
+        ] = {}
+        self._cache_version = 0
+        self._cache_lock = threading.Lock()
+
     def get_all_artworks(
-        self, featured: Optional[bool] = None, sold: Optional[bool] = None
+        self,
+        featured: Optional[bool] = None,
+        sold: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
     ) -> List[Artwork]:
-        """すべての作品を取得.
+        """作品を新しい順に最大 limit 件取得.
 
         Args:
             featured: おすすめ作品でフィルタリング
             sold: 販売済みでフィルタリング
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
 
         Returns:
             作品エンティティのリスト"""
-        return self.repository.find_all(featured=featured, sold=sold)
+        return self.repository.find_all(featured=featured, sold=sold, limit=limit, offset=offset)
+
+    def get_all_artworks_json(
+        self,
+        featured: Optional[bool] = None,
+        sold: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> bytes:
+        """作品一覧の1ページを JSON にシリアライズして取得.
+
+        シリアライズ結果はフィルタ条件とページごとに ARTWORK_LIST_CACHE_TTL 秒間キャッシュされ、
+        その間はデータベースへの問い合わせとシリアライズを行いません。
+        1ページは get_artwork_list で MAX_PAGE_SIZE 件以下に制限されるため、レスポンスを
+        ストリーミングせず、1つのバイト列として生成してキャッシュします。
+
+        Args:
+            featured: おすすめ作品でフィルタリング
+            sold: 販売済みでフィルタリング
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
+
+        Returns:
+            作品リストの JSON のバイト列"""
+        return self._get_list_entry(featured, sold, limit, offset)[1]
+
+    def get_artwork_list(
+        self,
+        featured: Optional[bool] = None,
+        sold: Optional[bool] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        offset: int = 0,
+    ) -> Tuple[str, bytes, bool]:
+        """作品一覧の1ページの ETag と JSON を取得.
+
+        ETag と JSON は同じキャッシュエントリから取り出すため、キャッシュの破棄や
+        有効期限切れと重なっても、返す JSON と対応しない ETag を返すことはありません。
+
+        Args:
+            featured: おすすめ作品でフィルタリング
+            sold: 販売済みでフィルタリング
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
+
+        Returns:
+            (ETag の値, 作品リストの JSON のバイト列, 次のページがあるか)。
+            ETag は作品が変更されない限り同じ値
+
+        Raises:
+            ValueError: limit が 1〜MAX_PAGE_SIZE の範囲外、または offset が負の場合"""
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit は 1 以上 {MAX_PAGE_SIZE} 以下で指定してください")
+        if offset < 0:
+            raise ValueError("offset は 0 以上で指定してください")
+        return self._get_list_entry(featured, sold, limit, offset)
+
+    def _get_list_entry(
+        self, featured: Optional[bool], sold: Optional[bool], limit: int, offset: int
+    ) -> Tuple[str, bytes, bool]:
+        """作品一覧の (ETag, JSON, 次のページがあるか) をキャッシュから取得する.
+
+        有効期限を過ぎたエントリは、作品テーブルのバージョン（集計クエリ1回）が変わっていなければ
+        作品を取得し直さずに有効期限だけを延長します。バージョンは updated_at から求めるため、
+        migrations/003 のトリガーで updated_at が維持されていることを前提とします。"""
+        key = (featured, sold, limit, offset, self._cache_version)
+        entry = self._json_cache.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1], entry[2], entry[3]
+
+        etag = f"{self.repository.get_version()}-{featured}-{sold}-{limit}-{offset}"
+        if entry is not None and entry[1] == etag:
+            body, has_more = entry[2], entry[3]
+        else:
+            # 1件多く取得し、次のページがあるかを判定する
+            artworks = self.get_all_artworks(
+                featured=featured, sold=sold, limit=limit + 1, offset=offset
+            )
+            has_more = len(artworks) > limit
+            body = encode_artworks(artworks[:limit])
+
+        with self._cache_lock:
+            # 取得中にキャッシュが破棄された場合は、古い可能性のある結果を保存しない
+            if key[-1] == self._cache_version:
+                # ページの組み合わせはクライアントが指定するため、上限を超えたら最も古いエントリを破棄する
+                cache = self._json_cache
+                if key not in cache and len(cache) >= ARTWORK_LIST_CACHE_MAX_ENTRIES:
+                    del cache[next(iter(cache))]
+                self._json_cache[key] = (
+                    time.monotonic() + ARTWORK_LIST_CACHE_TTL, etag, body, has_more
+                )
+        return etag, body, has_more
+
+    def invalidate_cache(self) -> None:
+        """作品一覧の JSON キャッシュを破棄する（作品を追加・更新・削除した際に呼び出す）."""
+        with self._cache_lock:
+            self._cache_version += 1
+            self._json_cache.clear()
 
     def get_artwork_by_id(self, artwork_id: int) -> Optional[Artwork]:
         """IDで作品を取得.
@@ -53,16 +208,40 @@ class ArtworkService:
             raise ValueError(f"作品ID {artwork_id} が見つかりません")
         return artwork
 
-    def get_featured_artworks(self) -> List[Artwork]:
-        """おすすめ作品を取得.
+    def get_artworks_by_ids(self, artwork_ids: Iterable[int]) -> Dict[int, Artwork]:
+        """複数のIDの作品をまとめて取得.
+
+        get_artwork_by_id をループで呼び出す代わりに使用し、1回のクエリで取得します。
+
+        Args:
+            artwork_ids: 作品IDのリスト
+
+        Returns:
+            作品IDをキー、作品エンティティを値とする辞書（見つからないIDは含まない）"""
+        return {artwork.id: artwork for artwork in self.repository.find_by_ids(artwork_ids)}
+
+    def get_featured_artworks(
+        self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0
+    ) -> List[Artwork]:
+        """おすすめ作品を新しい順に最大 limit 件取得.
+
+        Args:
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
 
         Returns:
             おすすめ作品のリスト"""
-        return self.repository.find_all(featured=True)
+        return self.repository.find_all(featured=True, limit=limit, offset=offset)
+
+    def get_available_artworks(
+        self, limit: int = DEFAULT_PAGE_SIZE, offset: int = 0
+    ) -> List[Artwork]:
+        """購入可能な作品を新しい順に最大 limit 件取得.
 
-    def get_available_artworks(self) -> List[Artwork]:
-        """購入可能な作品を取得.
+        Args:
+            limit: 取得する最大件数
+            offset: 読み飛ばす件数
 
         Returns:
             購入可能な作品のリスト"""
-        return self.repository.find_all(sold=False)
+        return self.repository.find_all(sold=False, limit=limit, offset=offset)
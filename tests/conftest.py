@@ -1,43 +1,18 @@
+import copy
 import pytest
+from contextlib import contextmanager
 from decimal import Decimal
-from unittest.mock import Mock, MagicMock, patch
-from pathlib import Path
-import os
-import shutil
+from functools import lru_cache
+from unittest.mock import Mock, MagicMock
 import sys # sys モジュールをインポート
 
 # my_propertiesモジュール自体はトップレベルでインポートしない。
 # 必要に応じて、sys.modules['my_properties'] 経由でモックする。
 
-# テスト用トークンの固定文言
-TEST_TOKEN_CONTENT = "test_backend_token_12345"
 
-
-@pytest.fixture(scope="session")
-def app(tmp_path_factory):
-    """テスト用Flaskアプリケーションインスタンスを作成."""
-
-    # 1. 一時的なトークンディレクトリを作成
-    temp_token_dir = tmp_path_factory.mktemp("tokens")
-
-    # テスト用トークンファイルのパス
-    test_token_file_path = temp_token_dir / "backend_token.txt"
-
-    # 2. ダミーのトークンファイルを作成
-    if not test_token_file_path.exists():
-        test_token_file_path.write_text(TEST_TOKEN_CONTENT)
-        test_token_file_path.chmod(0o600)
-        print(f"Generated test token file: {test_token_file_path}")
-
-    # my_properties モジュールを完全にモックする
-    # app.py がロードされる際に my_properties モジュールが参照されるため、
-    # sys.modules を操作して my_properties モジュール全体を MagicMock に置き換える
-    # このモックはセッション全体で有効になる
-    original_my_properties_module = sys.modules.get('my_properties')
+def _mock_my_properties_module() -> MagicMock:
+    """my_properties モジュール全体を置き換えるモックを作成."""
     mock_my_properties_module = MagicMock()
-    sys.modules['my_properties'] = mock_my_properties_module
-
-    # mock_my_properties_module の中の MyProperties クラスとモジュールレベルの TOKEN_FILE を設定
     mock_my_properties_module.MyProperties = MagicMock()
     # flask_cors の TypeError を避けるため、MyProperties.FRONTEND_URL は直接文字列を返すようにする
     mock_my_properties_module.MyProperties.FRONTEND_URL.return_value = "http://localhost:3000"
@@ -52,56 +27,130 @@ def app(tmp_path_factory):
     }
     # MyProperties.load_app_config が呼ばれても何も起きないようにする
     mock_my_properties_module.MyProperties.load_app_config.return_value = None
+    return mock_my_properties_module
+
+
+@lru_cache(maxsize=None)
+def _cached_app():
+    """my_properties をモックに置き換えた状態で Flask アプリケーションを作成.
+
+    プロセス内で一度だけ作成する（pytest-xdist では各ワーカーで一度ずつ）。"""
+    # app.py がロードされる際に my_properties モジュールが参照されるため、
+    # sys.modules を操作して my_properties モジュール全体を MagicMock に置き換える
+    if not isinstance(sys.modules.get('my_properties'), MagicMock):
+        sys.modules['my_properties'] = _mock_my_properties_module()
 
-    # my_properties モジュールレベルの TOKEN_FILE もモックする
-    # _get_token_from_file が my_properties.TOKEN_FILE を直接参照するため
-    mock_my_properties_module.TOKEN_FILE = test_token_file_path
-
-    # secrets-apiのHTTPリクエストをモック化
-    with patch("requests.get") as mock_get:
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"password": "test_db_password"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
-
-        # すべてのモックが有効な状態で app をインポートし、作成
-        from app import create_app
-
-        app = create_app()
-        # Flask 標準のテストフラグを有効化
-        app.config["TESTING"] = True
-
-        yield app
-
-    # テスト終了後、my_properties モジュールを元の状態に戻す
-    if original_my_properties_module:
-        sys.modules['my_properties'] = original_my_properties_module
-    else:
-        del sys.modules['my_properties']
-
-    # 4. クリーンアップ処理 (yieldの後)
-    if test_token_file_path.exists():
-        try:
-            current_content = test_token_file_path.read_text().strip()
-            if current_content == TEST_TOKEN_CONTENT:
-                test_token_file_path.unlink()
-                print(
-                    f"Deleted test token file with matching content: {test_token_file_path}"
-                )
-            else:
-                print(
-                    f"Skipping deletion of test token file (content mismatch): {test_token_file_path}"
-                )
-        except Exception as e:
-            print(f"Error during test token file cleanup: {e}")
+    import app as app_module
+
+    # app.py のインポート時に作成されたアプリケーションを create_app() を再度呼ばずに使う
+    flask_app = app_module.app
+    # Flask 標準のテストフラグを有効化
+    flask_app.config["TESTING"] = True
+    # ルーティングテーブルは初回のマッチング時に構築されるため、最初のテストの実行時間に
+    # 含まれないようにここで構築しておく
+    flask_app.url_map.bind("localhost").match("/api/health")
+    return flask_app
+
+
+@pytest.fixture(scope="session")
+def app():
+    """テスト用Flaskアプリケーションインスタンスを返す（プロセス全体で1つ）.
+
+    my_properties モジュール全体をモックに置き換えてから app をインポートするため、
+    設定ファイルの読み込みや secrets-api（トークンファイル・パスワード取得）には一切アクセスしない。"""
+    original_my_properties_module = sys.modules.get('my_properties')
+
+    try:
+        yield _cached_app()
+    finally:
+        # テスト終了後、my_properties モジュールを元の状態に戻す
+        if original_my_properties_module:
+            sys.modules['my_properties'] = original_my_properties_module
+        else:
+            sys.modules.pop('my_properties', None)
+
+
+class StubArtworkService:
+    """ルートから呼び出される ArtworkService のメソッドだけを持つ軽量なスタブ.
+
+    Mock(spec=ArtworkService) と異なりクラスの調査を行わないため、作成が軽量。
+    各メソッドは Mock のため、assert_called_once_with などで呼び出しを検証できる。"""
+
+    def __init__(self):
+        self.get_all_artworks_json = Mock()
+        self.get_artwork_list = Mock(return_value=("v1", b"[]", False))
+        self.get_artwork_by_id = Mock()
+
+
+@pytest.fixture
+def mock_artwork_service():
+    """ArtworkServiceのスタブインスタンスを作成."""
+    return StubArtworkService()
 
 
 @pytest.fixture
-def client(app):
-    """テストクライアントインスタンスを作成."""
+def artwork_service_override(app, mock_artwork_service):
+    """app.artwork_service_provider を差し替えてモックサービスを注入する.
+
+    サービスのプロバイダはテスト終了後に元に戻すため、セッションで共有するアプリケーションに
+    前のテストのモックが残ることはない。"""
+    original_provider = app.artwork_service_provider
+    app.artwork_service_provider = lambda: mock_artwork_service
+    try:
+        yield mock_artwork_service
+    finally:
+        app.artwork_service_provider = original_provider
+
+
+@pytest.fixture
+def client(app, artwork_service_override):
+    """モックサービスを注入したテストクライアントインスタンスを作成（アプリケーションは再作成しないため軽量）."""
     return app.test_client()
 
 
+@pytest.fixture(scope="session")
+def _get_environ():
+    """パスごとに GET リクエストの WSGI environ を一度だけ作成して返す関数"""
+    from werkzeug.test import EnvironBuilder
+
+    @lru_cache(maxsize=None)
+    def _build(path):
+        return EnvironBuilder(path=path, method="GET").get_environ()
+
+    return _build
+
+
+@pytest.fixture
+def wsgi_get(app, artwork_service_override, _get_environ):
+    """テストクライアントを介さずに WSGI アプリケーションを直接呼び出して GET する関数.
+
+    environ は作成済みのものをコピーして使うため、単純な GET を繰り返すテストで
+    テストクライアントのリクエスト組み立てを省略できる。"""
+    from werkzeug.wrappers import Response
+
+    def _wsgi_get(path):
+        return Response.from_app(app.wsgi_app, dict(_get_environ(path)))
+
+    return _wsgi_get
+
+
+@pytest.fixture(autouse=True)
+def fake_db_cursor(monkeypatch):
+    """Database.get_cursor をモックのカーソルに差し替える（テストからはデータベースに接続しない）.
+
+    特定の行を返す必要があるテストでは ``fake_db_cursor.fetchall.return_value`` などを設定する。"""
+    from repositories.database import Database
+
+    cursor = MagicMock()
+
+    @contextmanager
+    def get_cursor(*args, **kwargs):
+        yield cursor
+
+    monkeypatch.setattr(Database, "get_cursor", get_cursor)
+    return cursor
+
+
 @pytest.fixture
 def artwork_repository():
     """ArtworkRepositoryのモックインスタンスを作成."""
@@ -110,9 +159,11 @@ def artwork_repository():
     return Mock(spec=ArtworkRepository)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_artwork_dict():
-    """テスト用の作品データ (辞書形式)"""
+    """テスト用の作品データ (辞書形式。セッション全体で共有するため変更しないこと)
+
+    値を変えたい場合は ``{**sample_artwork_dict, "is_sold": True}`` のようにコピーして使用する。"""
     return {
         "id": 1,
         "title": "テスト作品",
@@ -127,9 +178,15 @@ def sample_artwork_dict():
     }
 
 
-@pytest.fixture
-def sample_artwork(sample_artwork_dict):
-    """テスト用の作品エンティティ"""
+@pytest.fixture(scope="module")
+def _sample_artwork_template(sample_artwork_dict):
+    """テスト用の作品エンティティのひな形（モジュール内で一度だけ作成する。変更しないこと）"""
     from domain.artwork import Artwork
 
     return Artwork.from_dict(sample_artwork_dict)
+
+
+@pytest.fixture
+def sample_artwork(_sample_artwork_template):
+    """テスト用の作品エンティティ（ひな形のコピーのため、テスト内で変更してもよい）"""
+    return copy.copy(_sample_artwork_template)
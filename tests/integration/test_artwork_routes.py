@@ -4,88 +4,171 @@
 Flask test clientを使用してHTTPリクエストをテストします。
 """
 
+from unittest.mock import call
+
 import pytest
-from unittest.mock import Mock
-# from app import create_app  # テスト収集時の意図しないアプリ生成を防ぐため削除
 from domain.artwork import Artwork  # Artworkエンティティをインポート
-from decimal import Decimal
-from services.artwork_service import ArtworkService  # 追加
+from services.artwork_service import encode_artworks
 
 
 @pytest.mark.integration
 class TestArtworkEndpoints:
     """作品エンドポイントのテスト"""
 
-    @pytest.fixture
-    def mock_artwork_service(self):
-        """ArtworkServiceのモックインスタンスを作成"""
-        return Mock(spec=ArtworkService)
-
-    @pytest.fixture
-    def client(self, app, mock_artwork_service):
-        """テストクライアントインスタンスを作成し、モックサービスを注入"""
-        # 引数 app は conftest.py のフィクスチャから提供される
-        app.artwork_service = (
-            mock_artwork_service  # アプリケーションにモックサービスを注入
-        )
-        return app.test_client()
-
-    def test_get_artworks(self, client, mock_artwork_service, sample_artwork):
+    def test_get_artworks(self, wsgi_get, mock_artwork_service, sample_artwork):
         """作品一覧取得エンドポイントをテスト"""
         # モックの戻り値を設定
-        mock_artwork_service.get_all_artworks.return_value = [sample_artwork]
+        mock_artwork_service.get_artwork_list.return_value = (
+            "v1", encode_artworks([sample_artwork]), False
+        )
 
-        response = client.get("/api/artworks")
+        response = wsgi_get("/api/artworks")
 
         assert response.status_code == 200
         data = response.get_json()
         assert isinstance(data, list)
         assert len(data) == 1
         assert data[0]["id"] == sample_artwork.id
-        mock_artwork_service.get_all_artworks.assert_called_once_with(
-            featured=None, sold=None
+        assert response.cache_control.public is True
+        assert response.cache_control.max_age == 60
+        assert response.get_etag() == ("v1", True)
+        mock_artwork_service.get_artwork_list.assert_called_once_with(
+            featured=None, sold=None, limit=100, offset=0
         )  # サービスが呼ばれたことを検証
 
+    def test_get_artworks_not_modified(self, client, mock_artwork_service):
+        """ETag が一致する場合は本文を返さずに 304 を返すことを確認"""
+        response = client.get("/api/artworks", headers={"If-None-Match": 'W/"v1"'})
+
+        assert response.status_code == 304
+        assert response.data == b""
+        assert response.get_etag() == ("v1", True)
+        mock_artwork_service.get_artwork_list.assert_called_once_with(
+            featured=None, sold=None, limit=100, offset=0
+        )
+
     def test_get_artworks_with_featured_filter(
-        self, client, mock_artwork_service, sample_artwork
+        self, client, mock_artwork_service, sample_artwork_dict
     ):
         """おすすめ作品フィルタリングをテスト"""
-        featured_artwork = Artwork.from_dict(
-            {**sample_artwork.to_dict(), "is_featured": True}
-        )
-        mock_artwork_service.get_all_artworks.return_value = [featured_artwork]
+        featured_artwork = Artwork.from_dict({**sample_artwork_dict, "is_featured": True})
+        body = encode_artworks([featured_artwork])
+        mock_artwork_service.get_artwork_list.return_value = ("v1", body, False)
 
         response = client.get("/api/artworks?featured=true")
 
         assert response.status_code == 200
-        data = response.get_json()
-        assert isinstance(data, list)
-        assert len(data) == 1
-        assert data[0]["is_featured"] is True
-        mock_artwork_service.get_all_artworks.assert_called_once_with(
-            featured=True, sold=None
+        # サービスが返した JSON をそのまま返すため、パースせずにバイト列で検証する
+        assert response.data == body
+        assert b'"is_featured":true' in response.data
+        mock_artwork_service.get_artwork_list.assert_called_once_with(
+            featured=True, sold=None, limit=100, offset=0
         )
 
     def test_get_artworks_with_sold_filter(
-        self, client, mock_artwork_service, sample_artwork
+        self, client, mock_artwork_service, sample_artwork_dict
     ):
         """販売済みフィルタリングをテスト"""
-        available_artwork = Artwork.from_dict(
-            {**sample_artwork.to_dict(), "is_sold": False}
-        )
-        mock_artwork_service.get_all_artworks.return_value = [available_artwork]
+        available_artwork = Artwork.from_dict({**sample_artwork_dict, "is_sold": False})
+        body = encode_artworks([available_artwork])
+        mock_artwork_service.get_artwork_list.return_value = ("v1", body, False)
 
         response = client.get("/api/artworks?sold=false")
 
+        assert response.status_code == 200
+        # サービスが返した JSON をそのまま返すため、パースせずにバイト列で検証する
+        assert response.data == body
+        assert b'"is_sold":false' in response.data
+        mock_artwork_service.get_artwork_list.assert_called_once_with(
+            featured=None, sold=False, limit=100, offset=0
+        )
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("featured=1", {"featured": True, "sold": None, "limit": 100, "offset": 0}),
+            ("featured=YES&sold=off", {"featured": True, "sold": False, "limit": 100, "offset": 0}),
+            ("featured=unknown", {"featured": None, "sold": None, "limit": 100, "offset": 0}),
+            ("limit=20&offset=40", {"featured": None, "sold": None, "limit": 20, "offset": 40}),
+        ],
+    )
+    def test_get_artworks_filter_values(self, client, mock_artwork_service, query, expected):
+        """真偽値として解釈するクエリパラメータの値をテスト"""
+        response = client.get(f"/api/artworks?{query}")
+
+        assert response.status_code == 200
+        mock_artwork_service.get_artwork_list.assert_called_once_with(**expected)
+
+    def test_get_artworks_next_page_link(self, client, mock_artwork_service):
+        """次のページがある場合は、同じ条件で続きを取得する URL を Link ヘッダーに設定することを確認"""
+        mock_artwork_service.get_artwork_list.return_value = ("v1", b"[]", True)
+
+        response = client.get("/api/artworks?featured=true&limit=20&offset=40")
+
+        assert response.status_code == 200
+        assert response.headers["Link"] == (
+            '</api/artworks?featured=true&limit=20&offset=60>; rel="next"'
+        )
+
+    def test_get_artworks_last_page_has_no_link(self, client):
+        """最後のページには Link ヘッダーを設定しないことを確認"""
+        response = client.get("/api/artworks")
+
+        assert response.status_code == 200
+        assert "Link" not in response.headers
+
+    @pytest.mark.parametrize("query", ["limit=abc", "offset=1.5"])
+    def test_get_artworks_invalid_page(self, client, mock_artwork_service, query):
+        """limit・offset が整数でない場合は 400 を返すことを確認"""
+        response = client.get(f"/api/artworks?{query}")
+
+        assert response.status_code == 400
+        assert "整数" in response.get_json()["error"]
+        mock_artwork_service.get_artwork_list.assert_not_called()
+
+    def test_get_artworks_out_of_range_page(self, client, mock_artwork_service):
+        """サービスが範囲外と判定した場合は 400 を返すことを確認"""
+        mock_artwork_service.get_artwork_list.side_effect = ValueError("limit は範囲外です")
+
+        response = client.get("/api/artworks?limit=0")
+
+        assert response.status_code == 400
+        assert response.get_json() == {"error": "limit は範囲外です"}
+
+    def test_get_artworks_overview(self, client, mock_artwork_service, sample_artwork):
+        """おすすめ作品と購入可能な作品の一覧をまとめて取得するエンドポイントをテスト"""
+        mock_artwork_service.get_artwork_list.side_effect = [
+            ("v1-featured", encode_artworks([sample_artwork]), False),
+            ("v1-available", encode_artworks([sample_artwork]), True),
+        ]
+
+        response = client.get("/api/artworks/overview")
+
         assert response.status_code == 200
         data = response.get_json()
-        assert isinstance(data, list)
-        assert len(data) == 1
-        assert data[0]["is_sold"] is False
-        mock_artwork_service.get_all_artworks.assert_called_once_with(
-            featured=None, sold=False
+        assert data["featured"][0]["id"] == sample_artwork.id
+        assert data["available"][0]["id"] == sample_artwork.id
+        assert response.headers["ETag"] == 'W/"v1-featured:v1-available"'
+        assert response.cache_control.max_age == 60
+        assert mock_artwork_service.get_artwork_list.call_args_list == [
+            call(featured=True), call(sold=False)
+        ]
+
+    def test_get_artworks_overview_not_modified(self, client, mock_artwork_service):
+        """If-None-Match が両方の一覧の ETag と一致する場合は 304 を返すことを確認"""
+        mock_artwork_service.get_artwork_list.side_effect = [
+            ("v1-featured", b"[]", False),
+            ("v1-available", b"[]", False),
+        ]
+
+        response = client.get(
+            "/api/artworks/overview",
+            headers={"If-None-Match": 'W/"v1-featured:v1-available"'},
         )
 
+        assert response.status_code == 304
+        assert response.data == b""
+
     def test_get_artwork_by_id_success(
         self, client, mock_artwork_service, sample_artwork
     ):
@@ -98,6 +181,8 @@ class TestArtworkEndpoints:
         data = response.get_json()
         assert data["id"] == sample_artwork.id
         assert "title" in data
+        assert data == sample_artwork.to_dict()  # to_dict() と同じ形式で返すこと
+        assert response.cache_control.max_age == 300
         mock_artwork_service.get_artwork_by_id.assert_called_once_with(
             sample_artwork.id
         )
@@ -113,16 +198,12 @@ class TestArtworkEndpoints:
         assert response.status_code == 404
         data = response.get_json()
         assert "error" in data
+        assert response.cache_control.max_age is None  # エラーはキャッシュさせない
         mock_artwork_service.get_artwork_by_id.assert_called_once_with(99999)
 
-    @pytest.mark.skip(reason="CI/CDの優先順位のため、一旦スキップ")  # 追加
     def test_get_artwork_by_id_invalid_id(self, client, mock_artwork_service):
         """作品詳細取得エンドポイントをテスト（不正なID形式）"""
         response = client.get("/api/artworks/abc")  # 数値以外のID
 
-        assert response.status_code == 404  # 404 Not Found を期待
-        # Flaskのデフォルト404はHTMLを返すため、JSONボディの検証は削除
-        # data = response.get_json()
-        # assert 'error' in data
-        # assert 'Not Found' in data['error']
+        assert response.status_code == 404  # ルートに一致しないため 404 Not Found
         mock_artwork_service.get_artwork_by_id.assert_not_called()  # サービスは呼ばれない
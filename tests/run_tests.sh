@@ -9,6 +9,10 @@ GREEN='\033[0;32m'
 YELLOW='\033[1;33m'
 NC='\033[0m' # No Color
 
+# pytest-xdist で並列実行する（loadfile: 同じファイルのテストは同じワーカーで実行し、
+# セッションスコープの app フィクスチャをワーカーごとに一度だけ作成する）
+PARALLEL="-n auto --dist loadfile"
+
 # テストタイプの選択
 echo "テストタイプを選択してください:"
 echo "1) すべてのテスト"
@@ -20,24 +24,24 @@ read -p "選択 (1-4): " choice
 case $choice in
     1)
         echo -e "${GREEN}すべてのテストを実行します...${NC}"
-        pytest
+        pytest -m "unit or integration" $PARALLEL
         ;;
     2)
         echo -e "${GREEN}ユニットテストを実行します...${NC}"
-        pytest tests/unit/ -m unit -v
+        pytest tests/unit/ -m unit -v $PARALLEL
         ;;
     3)
         echo -e "${GREEN}結合テストを実行します...${NC}"
-        pytest tests/integration/ -m integration -v
+        pytest tests/integration/ -m integration -v $PARALLEL
         ;;
     4)
         echo -e "${GREEN}カバレッジレポート付きでテストを実行します...${NC}"
-        pytest --cov=src/backend --cov-report=html:tests/htmlcov --cov-report=term-missing
+        pytest -m "unit or integration" $PARALLEL --cov=src/backend --cov-report=html:tests/htmlcov --cov-report=term-missing
         echo -e "${YELLOW}カバレッジレポート: tests/htmlcov/index.html${NC}"
         ;;
     *)
         echo "無効な選択です。すべてのテストを実行します。"
-        pytest
+        pytest -m "unit or integration" $PARALLEL
         ;;
 esac
 
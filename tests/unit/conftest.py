@@ -0,0 +1,28 @@
+"""
+ユニットテスト共通のフィクスチャ
+
+作品エンティティはルートの conftest.py のひな形（_sample_artwork_template）から作成します。
+"""
+
+import dataclasses
+
+import pytest
+
+
+@pytest.fixture
+def make_artwork(_sample_artwork_template):
+    """必要な項目だけを指定して作品エンティティを作成するファクトリ（指定しない項目はひな形の値）"""
+
+    def _make_artwork(**kwargs):
+        return dataclasses.replace(_sample_artwork_template, **kwargs)
+
+    return _make_artwork
+
+
+@pytest.fixture(scope="module")
+def artwork_50k(_sample_artwork_template):
+    """価格 50000 円の作品エンティティ（モジュール内で共有するため、テストでは変更しないこと）.
+
+    sample_artwork_dict の価格（50000 円）から作成したひな形そのものを返すため、
+    変更が必要なテストでは ``sample_artwork`` を使用する。"""
+    return _sample_artwork_template
@@ -13,80 +13,27 @@ from domain.artwork import Artwork
 class TestArtwork:
     """作品エンティティのテストクラス"""
 
-    def test_is_available_when_not_sold(self):
-        """販売済みでない場合、購入可能であることを確認"""
-        artwork = Artwork(
-            id=1,
-            title="テスト作品",
-            description=None,
-            image_url=None,
-            price=None,
-            size=None,
-            medium=None,
-            year=None,
-            is_sold=False,
-        )
-        assert artwork.is_available() is True
-
-    def test_is_available_when_sold(self):
-        """販売済みの場合、購入不可能であることを確認"""
-        artwork = Artwork(
-            id=1,
-            title="テスト作品",
-            description=None,
-            image_url=None,
-            price=None,
-            size=None,
-            medium=None,
-            year=None,
-            is_sold=True,
-        )
-        assert artwork.is_available() is False
-
-    def test_can_be_featured_when_not_sold(self):
-        """販売済みでない場合、おすすめに設定可能であることを確認"""
-        artwork = Artwork(
-            id=1,
-            title="テスト作品",
-            description=None,
-            image_url=None,
-            price=None,
-            size=None,
-            medium=None,
-            year=None,
-            is_sold=False,
-        )
-        assert artwork.can_be_featured() is True
-
-    def test_can_be_featured_when_sold(self):
-        """販売済みの場合、おすすめに設定不可能であることを確認"""
-        artwork = Artwork(
-            id=1,
-            title="テスト作品",
-            description=None,
-            image_url=None,
-            price=None,
-            size=None,
-            medium=None,
-            year=None,
-            is_sold=True,
-        )
-        assert artwork.can_be_featured() is False
-
-    def test_mark_as_sold(self):
+    @pytest.mark.parametrize(
+        "is_sold, expected",
+        [(False, True), (True, False)],
+        ids=["not_sold", "sold"],
+    )
+    def test_is_available(self, make_artwork, is_sold, expected):
+        """販売済みでない場合のみ購入可能であることを確認"""
+        assert make_artwork(is_sold=is_sold).is_available() is expected
+
+    @pytest.mark.parametrize(
+        "is_sold, expected",
+        [(False, True), (True, False)],
+        ids=["not_sold", "sold"],
+    )
+    def test_can_be_featured(self, make_artwork, is_sold, expected):
+        """販売済みでない場合のみおすすめに設定可能であることを確認"""
+        assert make_artwork(is_sold=is_sold).can_be_featured() is expected
+
+    def test_mark_as_sold(self, make_artwork):
         """販売済みとしてマークする機能をテスト"""
-        artwork = Artwork(
-            id=1,
-            title="テスト作品",
-            description=None,
-            image_url=None,
-            price=None,
-            size=None,
-            medium=None,
-            year=None,
-            is_featured=True,
-            is_sold=False,
-        )
+        artwork = make_artwork(is_featured=True, is_sold=False)
 
         artwork.mark_as_sold()
 
@@ -105,6 +52,38 @@ class TestArtwork:
         assert artwork.is_featured is True
         assert artwork.is_sold is False
 
+    def test_from_dict_converts_non_decimal_price(self, sample_artwork_dict):
+        """Decimal 以外の価格（JSON由来の数値や文字列）は Decimal に変換されることを確認"""
+        assert Artwork.from_dict({**sample_artwork_dict, "price": 50000}).price == Decimal("50000")
+        assert Artwork.from_dict({**sample_artwork_dict, "price": "500.5"}).price == Decimal("500.5")
+        assert Artwork.from_dict({**sample_artwork_dict, "price": None}).price is None
+
+    def test_from_row(self, sample_artwork_dict):
+        """データベースの行（タプル）からエンティティを生成する機能をテスト"""
+        artwork = Artwork.from_row(tuple(sample_artwork_dict.values()))
+
+        assert artwork == Artwork.from_dict(sample_artwork_dict)
+
+    def test_from_rows(self, sample_artwork_dict):
+        """複数の行からエンティティのリストを生成する機能をテスト"""
+        row = tuple(sample_artwork_dict.values())
+
+        artworks = Artwork.from_rows([row, row])
+
+        assert artworks == [Artwork.from_row(row)] * 2
+        assert Artwork.from_rows([]) == []
+
+    def test_to_json_dict(self, sample_artwork):
+        """日時を datetime のまま残す以外は to_dict() と同じ辞書を返すことを確認"""
+        result = sample_artwork.to_json_dict()
+        expected = sample_artwork.to_dict()
+
+        assert result["created_at"] == sample_artwork.created_at
+        assert result["updated_at"] == sample_artwork.updated_at
+        assert {**result, "created_at": None, "updated_at": None} == {
+            **expected, "created_at": None, "updated_at": None
+        }
+
     def test_to_dict(self, sample_artwork):
         """エンティティを辞書形式に変換する機能をテスト"""
         result = sample_artwork.to_dict()
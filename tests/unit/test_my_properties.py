@@ -0,0 +1,189 @@
+"""
+設定管理モジュールのユニットテスト
+
+secrets-api への問い合わせをモックし、設定ファイル・トークン・パスワードの読み込みと
+キャッシュの動作を検証します。
+"""
+
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+import my_properties
+
+
+CONFIG_YAML = """\
+server:
+  port: 5000
+  flask_env: production
+database:
+  host: db
+  port: 5432
+  name: gallery
+  user: app
+  pool_max: 4
+secrets_api:
+  url: http://secrets
+frontend:
+  url: http://localhost:3000
+"""
+
+
+@pytest.fixture(autouse=True)
+def clear_password_cache(monkeypatch):
+    """テスト間でパスワードのキャッシュを共有しないようにする"""
+    monkeypatch.setattr(my_properties, "_password_cache", None)
+
+
+@pytest.fixture
+def config_file(tmp_path, monkeypatch):
+    """一時ディレクトリの config.yaml を参照するようにする"""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    monkeypatch.setattr(my_properties, "CONFIG_FILE", path)
+    return path
+
+
+@pytest.fixture
+def secrets_api(monkeypatch):
+    """secrets-api の HTTP セッションをモックに置き換える"""
+    session = Mock()
+    session.get.return_value.content = b'{"password": "pw1"}'
+    monkeypatch.setattr(my_properties, "_get_http_session", lambda: session)
+    return session
+
+
+@pytest.mark.unit
+class TestGetPasswordFromApi:
+    """パスワード取得のテストクラス"""
+
+    def test_reuses_password_after_token_is_consumed(self, tmp_path, secrets_api):
+        """使用済みトークンが削除された後の再読み込みでは、キャッシュ済みのパスワードを返すことを確認"""
+        token_file = tmp_path / "backend_token.txt"
+        token_file.write_text("token1")
+        config = {"secrets_api": {"url": "http://secrets", "token_file": str(token_file)}}
+
+        assert my_properties._get_password_from_api(config) == "pw1"
+
+        # secrets-api がワンタイムトークンを破棄した後の再読み込み
+        token_file.unlink()
+        assert my_properties._get_password_from_api(config) == "pw1"
+        assert secrets_api.get.call_count == 1
+
+        # 新しいトークンが置かれた場合は再取得する
+        secrets_api.get.return_value.content = b'{"password": "pw2"}'
+        token_file.write_text("token2")
+        stat = token_file.stat()
+        os.utime(token_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert my_properties._get_password_from_api(config) == "pw2"
+        assert secrets_api.get.call_count == 2
+        assert secrets_api.get.call_args.kwargs["headers"] == {"Authorization": "Bearer token2"}
+
+
+@pytest.mark.unit
+class TestGetTokenFromFile:
+    """トークンファイル読み込みのテストクラス"""
+
+    def test_reads_token_written_while_polling(self, tmp_path):
+        """待機中に書き出されたトークンを、リトライ間隔を待たずに読み込むことを確認"""
+        token_file = tmp_path / "backend_token.txt"
+        timer = threading.Timer(0.1, token_file.write_text, args=("token\n",))
+        timer.start()
+        try:
+            started = time.monotonic()
+            token = my_properties._get_token_from_file(
+                max_retries=3, retry_interval=5, token_file=token_file
+            )
+        finally:
+            timer.cancel()
+
+        assert token == "token"
+        assert time.monotonic() - started < 1
+
+    def test_raises_after_deadline(self, tmp_path):
+        """(max_retries - 1) * retry_interval 秒待ってもファイルがなければ例外を送出することを確認"""
+        started = time.monotonic()
+        with pytest.raises(RuntimeError, match="トークンファイルが見つかりません"):
+            my_properties._get_token_from_file(
+                max_retries=2, retry_interval=0.2, token_file=tmp_path / "missing.txt"
+            )
+
+        assert 0.2 <= time.monotonic() - started < 1
+
+
+@pytest.mark.unit
+class TestLoadConfigFile:
+    """config.yaml 読み込みのテストクラス"""
+
+    def test_load_config_file(self, config_file):
+        """YAML を解析し、設定ディレクトリにファイルを書き出さないことを確認"""
+        config = my_properties._load_config_file()
+
+        assert config["database"]["host"] == "db"
+        assert list(config_file.parent.iterdir()) == [config_file]
+
+    def test_empty_config_file(self, config_file):
+        """空の設定ファイルはエラーとすることを確認"""
+        config_file.write_text("", encoding="utf-8")
+
+        with pytest.raises(RuntimeError, match="が空です"):
+            my_properties._load_config_file()
+
+    def test_missing_config_file(self, config_file):
+        """設定ファイルがなければ FileNotFoundError を送出することを確認"""
+        config_file.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            my_properties._load_config_file()
+
+
+@pytest.mark.unit
+class TestMyProperties:
+    """MyProperties の設定値解決のテストクラス"""
+
+    @pytest.fixture(autouse=True)
+    def loaded(self, config_file, monkeypatch):
+        """パスワード取得をモックして設定をロードする"""
+        monkeypatch.setattr(my_properties, "_get_password_from_api", lambda config: "secret")
+        monkeypatch.setattr(my_properties.MyProperties, "_loaded", False)
+        my_properties._load_config.cache_clear()
+        yield
+        my_properties._load_config.cache_clear()
+
+    def test_resolves_values(self):
+        """設定ファイルの値と既定値を解決することを確認"""
+        props = my_properties.MyProperties
+
+        assert props.PORT() == 5000
+        assert props.FLASK_ENV() == "production"
+        assert props.DEBUG() is False
+        assert props.FRONTEND_URL() == "http://localhost:3000"
+        assert props.DB_PASSWORD() == "secret"
+        assert props.DB_POOL_MIN() == 2
+        assert props.DB_POOL_MAX() == 4
+        assert props.SECRETS_API_URL() == "http://secrets"
+
+    def test_get_db_config(self):
+        """接続設定に libpq の追加パラメータを含め、呼び出しごとに複製を返すことを確認"""
+        db_config = my_properties.MyProperties.get_db_config()
+
+        assert db_config["database"] == "gallery"
+        assert db_config["password"] == "secret"
+        assert db_config["connect_timeout"] == my_properties.DB_CONNECTION_OPTIONS["connect_timeout"]
+
+        db_config["host"] = "changed"
+        assert my_properties.MyProperties.DB_HOST() == "db"
+
+    def test_load_app_config_parses_once(self, monkeypatch):
+        """load_app_config を繰り返し呼び出しても、設定ファイルは一度だけ読み込むことを確認"""
+        load_config_file = Mock(wraps=my_properties._load_config_file)
+        monkeypatch.setattr(my_properties, "_load_config_file", load_config_file)
+
+        my_properties.MyProperties.load_app_config()
+        my_properties.MyProperties.load_app_config()
+
+        load_config_file.assert_called_once_with()
+        assert my_properties.MyProperties.DB_NAME() == "gallery"
@@ -0,0 +1,207 @@
+"""
+作品リポジトリのユニットテスト
+
+データベースアクセスをモックし、リポジトリ内のロジックを検証します。
+"""
+
+from unittest.mock import patch
+
+import pytest
+from repositories import artwork_repository
+from repositories.artwork_repository import ArtworkRepository, _TitleCache
+
+
+@pytest.fixture
+def fake_cursor(fake_db_cursor):
+    """モックのカーソルに Database.execute_prepared の呼び出しを記録する"""
+    with patch.object(artwork_repository.Database, "execute_prepared") as execute_prepared:
+        fake_db_cursor.execute_prepared = execute_prepared
+        yield fake_db_cursor
+
+
+@pytest.fixture(autouse=True)
+def clear_title_cache():
+    """テスト間でタイトルキャッシュを共有しないようにする"""
+    artwork_repository._title_cache.clear()
+    yield
+    artwork_repository._title_cache.clear()
+
+
+@pytest.mark.unit
+class TestArtworkRepositoryFindAll:
+    """一覧取得のテストクラス"""
+
+    def test_find_all_default_page(self, fake_cursor):
+        """件数を指定しなければ既定のページサイズで取得することを確認"""
+        fake_cursor.fetchall.return_value = []
+
+        ArtworkRepository.find_all(featured=True)
+
+        name, statement, params = fake_cursor.execute_prepared.call_args.args[1:]
+        assert name == "artworks_find_all_featured"
+        assert "LIMIT $1 OFFSET $2" in statement
+        assert params == (artwork_repository.DEFAULT_PAGE_SIZE, 0)
+
+    def test_find_all_with_page(self, fake_cursor):
+        """件数と開始位置を指定した場合はそのままパラメータに渡すことを確認"""
+        fake_cursor.fetchall.return_value = []
+
+        ArtworkRepository.find_all(limit=20, offset=40)
+
+        assert fake_cursor.execute_prepared.call_args.args[3] == (20, 40)
+
+
+@pytest.mark.unit
+class TestArtworkRepositoryFindById:
+    """ID指定の取得のテストクラス"""
+
+    def test_find_by_id(self, fake_cursor):
+        """タプルの行から作品エンティティを生成することを確認"""
+        fake_cursor.fetchone.return_value = (
+            1, "作品1", None, None, None, None, None, None, True, False, None, None
+        )
+
+        artwork = ArtworkRepository.find_by_id(1)
+
+        assert artwork.id == 1
+        assert artwork.title == "作品1"
+        assert artwork.is_featured is True
+
+    def test_find_by_id_not_found(self, fake_cursor):
+        """見つからない場合はNoneを返すことを確認"""
+        fake_cursor.fetchone.return_value = None
+
+        assert ArtworkRepository.find_by_id(1) is None
+
+
+@pytest.mark.unit
+class TestArtworkRepositoryBulkInsert:
+    """作品の一括登録のテストクラス"""
+
+    def test_bulk_insert(self, sample_artwork):
+        """登録する列の値をまとめて execute_values に渡すことを確認"""
+        with patch.object(artwork_repository, "execute_values") as execute_values:
+            execute_values.return_value = [(10,), (11,)]
+
+            ids = ArtworkRepository.bulk_insert([sample_artwork, sample_artwork])
+
+        assert ids == [10, 11]
+        rows = execute_values.call_args.args[2]
+        assert len(rows) == 2
+        assert rows[0][0] == sample_artwork.title
+        assert execute_values.call_args.kwargs["fetch"] is True
+
+    def test_bulk_insert_empty(self):
+        """登録する作品がない場合は問い合わせないことを確認"""
+        with patch.object(artwork_repository, "execute_values") as execute_values:
+            assert ArtworkRepository.bulk_insert([]) == []
+
+        execute_values.assert_not_called()
+
+
+@pytest.mark.unit
+class TestArtworkRepositoryGetVersion:
+    """作品テーブルのバージョン取得のテストクラス"""
+
+    def test_get_version(self, fake_cursor):
+        """集計クエリの結果をそのまま返すことを確認"""
+        fake_cursor.fetchone.return_value = ("abc",)
+
+        assert ArtworkRepository.get_version() == "abc"
+        assert fake_cursor.execute_prepared.call_args.args[1] == "artworks_get_version"
+
+
+@pytest.mark.unit
+class TestArtworkRepositoryFindByIds:
+    """複数IDの一括取得のテストクラス"""
+
+    def test_find_by_ids(self, fake_cursor):
+        """重複を除いたIDで1回だけ問い合わせることを確認"""
+        fake_cursor.fetchall.return_value = [
+            (1, "作品1", None, None, None, None, None, None, False, False, None, None)
+        ]
+
+        artworks = ArtworkRepository.find_by_ids([1, 2, 1])
+
+        assert [artwork.id for artwork in artworks] == [1]
+        assert fake_cursor.execute_prepared.call_args.args[-1] == ([1, 2],)
+
+    def test_find_by_ids_empty(self, fake_cursor):
+        """IDが空の場合は問い合わせないことを確認"""
+        assert ArtworkRepository.find_by_ids([]) == []
+        fake_cursor.execute_prepared.assert_not_called()
+
+
+@pytest.mark.unit
+class TestArtworkRepositoryTitleCache:
+    """作品タイトル取得のキャッシュのテストクラス"""
+
+    def test_find_title_by_id_is_cached(self, fake_cursor):
+        """2回目以降はデータベースに問い合わせないことを確認"""
+        fake_cursor.fetchone.return_value = {"title": "テスト作品"}
+
+        assert ArtworkRepository.find_title_by_id(1) == "テスト作品"
+        assert ArtworkRepository.find_title_by_id(1) == "テスト作品"
+
+        fake_cursor.execute_prepared.assert_called_once()
+
+    def test_find_title_by_id_not_found_is_not_cached(self, fake_cursor):
+        """見つからなかった結果はキャッシュしないことを確認"""
+        fake_cursor.fetchone.return_value = None
+
+        assert ArtworkRepository.find_title_by_id(1) is None
+        assert ArtworkRepository.find_title_by_id(1) is None
+
+        assert fake_cursor.execute_prepared.call_count == 2
+
+    def test_invalidate_title(self, fake_cursor):
+        """キャッシュを破棄すると再度データベースに問い合わせることを確認"""
+        fake_cursor.fetchone.return_value = {"title": "テスト作品"}
+        ArtworkRepository.find_title_by_id(1)
+
+        ArtworkRepository.invalidate_title(1)
+        fake_cursor.fetchone.return_value = {"title": "新しいタイトル"}
+
+        assert ArtworkRepository.find_title_by_id(1) == "新しいタイトル"
+        assert fake_cursor.execute_prepared.call_count == 2
+
+    def test_find_titles_by_ids(self, fake_cursor):
+        """キャッシュにないIDだけを1回のクエリで取得することを確認"""
+        fake_cursor.fetchone.return_value = {"title": "作品1"}
+        ArtworkRepository.find_title_by_id(1)
+        fake_cursor.fetchall.return_value = [(2, "作品2")]
+
+        titles = ArtworkRepository.find_titles_by_ids([1, 2, 3, 2])
+
+        assert titles == {1: "作品1", 2: "作品2"}
+        args = fake_cursor.execute_prepared.call_args.args
+        assert args[-1] == ([2, 3],)
+        assert ArtworkRepository.find_title_by_id(2) == "作品2"
+        assert fake_cursor.execute_prepared.call_count == 2
+
+    def test_find_titles_by_ids_all_cached(self, fake_cursor):
+        """すべてキャッシュ済みの場合はデータベースに問い合わせないことを確認"""
+        fake_cursor.fetchall.return_value = [(1, "作品1")]
+        ArtworkRepository.find_titles_by_ids([1])
+
+        assert ArtworkRepository.find_titles_by_ids([1]) == {1: "作品1"}
+        fake_cursor.execute_prepared.assert_called_once()
+
+    def test_title_cache_expires(self):
+        """有効期限を過ぎたタイトルは返さないことを確認"""
+        cache = _TitleCache(maxsize=10, ttl=0)
+        cache.set(1, "テスト作品")
+
+        assert cache.get(1) is None
+
+    def test_title_cache_evicts_oldest(self):
+        """上限を超えた場合は最も古いタイトルから破棄することを確認"""
+        cache = _TitleCache(maxsize=2, ttl=60)
+        cache.set(1, "作品1")
+        cache.set(2, "作品2")
+        cache.get(1)
+        cache.set(3, "作品3")
+
+        assert cache.get(1) == "作品1"
+        assert cache.get(2) is None
+        assert cache.get(3) == "作品3"
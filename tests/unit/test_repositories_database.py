@@ -0,0 +1,244 @@
+"""
+データベース接続管理のユニットテスト
+
+実際の PostgreSQL には接続せず、偽の接続とプールで接続の貸し出し・返却の動作を検証します。
+"""
+
+import threading
+import time
+from unittest.mock import Mock, call
+
+import psycopg2
+import pytest
+from psycopg2 import pool, sql
+from repositories import database
+from repositories.database import BoundedConnectionPool, Database, ManagedConnection, PooledConnection
+
+
+@pytest.fixture
+def fake_connect(monkeypatch):
+    """psycopg2.connect を偽の接続を返す関数に置き換える"""
+    connect = Mock(side_effect=lambda *args, **kwargs: Mock(closed=0))
+    monkeypatch.setattr(pool.psycopg2, "connect", connect)
+    return connect
+
+
+@pytest.fixture
+def offline_connection():
+    """サーバーに接続せずに生成した PooledConnection を返す.
+
+    非同期モードでは接続の確立を待たないため、SQL の組み立て（as_string）にだけ使用できる。"""
+    conn = PooledConnection("host=127.0.0.1 port=1 dbname=test", async_=1)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def fresh_pool(monkeypatch, fake_connect):
+    """設定をモックし、コネクションプールが未作成の状態にする"""
+    properties = Mock()
+    properties.DB_POOL_MIN.return_value = 0
+    properties.DB_POOL_MAX.return_value = 2
+    properties.get_db_config.return_value = {"host": "db", "dbname": "test"}
+    monkeypatch.setattr(database, "MyProperties", properties)
+    monkeypatch.setattr(database.atexit, "register", Mock())
+    monkeypatch.setattr(Database, "_pool", None)
+    yield
+    Database.close_pool()
+
+
+@pytest.mark.unit
+class TestPooledConnection:
+    """プール内で再利用される接続のテストクラス"""
+
+    def test_prepared_statements_per_connection(self):
+        """PREPARE 済みのステートメント名を接続ごとに別々に保持することを確認"""
+        first = PooledConnection("host=127.0.0.1 port=1 dbname=test", async_=1)
+        second = PooledConnection("host=127.0.0.1 port=1 dbname=test", async_=1)
+        try:
+            first.prepared_statements.add("stmt")
+
+            assert second.prepared_statements == set()
+        finally:
+            first.close()
+            second.close()
+
+
+@pytest.mark.unit
+class TestExecutePrepared:
+    """プリペアドステートメント実行のテストクラス"""
+
+    def test_prepares_once_per_connection(self, offline_connection):
+        """PREPARE は接続ごとに初回のみ送信し、以降は EXECUTE だけを送信することを確認"""
+        cursor = Mock(connection=offline_connection)
+
+        Database.execute_prepared(cursor, "find", "SELECT * FROM artworks WHERE id = $1", (1,))
+        Database.execute_prepared(cursor, "find", "SELECT * FROM artworks WHERE id = $1", (2,))
+
+        statements = [
+            (c.args[0].as_string(offline_connection), c.args[1:]) for c in cursor.execute.call_args_list
+        ]
+        assert statements == [
+            ('PREPARE "find" AS SELECT * FROM artworks WHERE id = $1', ()),
+            ('EXECUTE "find" (%s)', ((1,),)),
+            ('EXECUTE "find" (%s)', ((2,),)),
+        ]
+        assert offline_connection.prepared_statements == {"find"}
+
+    def test_execute_with_multiple_params(self, offline_connection):
+        """パラメータの数だけプレースホルダーを並べることを確認"""
+        cursor = Mock(connection=offline_connection)
+        offline_connection.prepared_statements.add("page")
+
+        Database.execute_prepared(cursor, "page", "unused", (10, 20))
+
+        cursor.execute.assert_called_once()
+        assert cursor.execute.call_args.args[0].as_string(offline_connection) == 'EXECUTE "page" (%s, %s)'
+        assert cursor.execute.call_args.args[1] == (10, 20)
+
+    def test_execute_without_params(self, offline_connection):
+        """パラメータがなければ括弧を付けずに EXECUTE することを確認"""
+        cursor = Mock(connection=offline_connection)
+
+        Database.execute_prepared(
+            cursor, "version", sql.SQL("SELECT count(*) FROM {}").format(sql.Identifier("artworks"))
+        )
+
+        statements = [
+            (c.args[0].as_string(offline_connection), c.args[1:]) for c in cursor.execute.call_args_list
+        ]
+        assert statements == [
+            ('PREPARE "version" AS SELECT count(*) FROM "artworks"', ()),
+            ('EXECUTE "version"', (None,)),
+        ]
+
+
+@pytest.mark.unit
+class TestManagedConnection:
+    """トランザクション管理とプールへの返却のテストクラス"""
+
+    def test_commits_and_returns_connection(self):
+        """例外がなければコミットし、接続を閉じずに返却することを確認"""
+        conn, connection_pool = Mock(closed=0), Mock()
+
+        with ManagedConnection(conn, connection_pool):
+            pass
+
+        conn.commit.assert_called_once()
+        connection_pool.putconn.assert_called_once_with(conn, close=False)
+
+    def test_rolls_back_on_error(self):
+        """例外があればロールバックし、例外を再送出することを確認"""
+        conn, connection_pool = Mock(closed=0), Mock()
+
+        with pytest.raises(ValueError):
+            with ManagedConnection(conn, connection_pool):
+                raise ValueError("error")
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        connection_pool.putconn.assert_called_once_with(conn, close=False)
+
+    @pytest.mark.parametrize("body_error", [None, ValueError], ids=["commit", "rollback"])
+    def test_discards_connection_when_transaction_end_fails(self, body_error):
+        """コミット・ロールバックに失敗した接続はプールに戻さずに閉じることを確認"""
+        conn, connection_pool = Mock(closed=0), Mock()
+        conn.commit.side_effect = conn.rollback.side_effect = psycopg2.OperationalError("lost")
+
+        with pytest.raises(psycopg2.OperationalError):
+            with ManagedConnection(conn, connection_pool):
+                if body_error:
+                    raise body_error("error")
+
+        connection_pool.putconn.assert_called_once_with(conn, close=True)
+
+    def test_discards_closed_connection(self):
+        """切断済みの接続はプールに戻さずに閉じることを確認"""
+        conn, connection_pool = Mock(closed=2), Mock()
+
+        with ManagedConnection(conn, connection_pool):
+            pass
+
+        connection_pool.putconn.assert_called_once_with(conn, close=True)
+
+
+@pytest.mark.unit
+class TestDatabasePool:
+    """コネクションプールの作成と破棄のテストクラス"""
+
+    def test_creates_pool_once(self, fresh_pool):
+        """複数のスレッドから同時に要求されても、プールを一度だけ作成することを確認"""
+        barrier = threading.Barrier(8)
+        pools = []
+
+        def get_pool():
+            barrier.wait()
+            pools.append(Database._get_pool())
+
+        threads = [threading.Thread(target=get_pool) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(p) for p in pools}) == 1
+        assert isinstance(pools[0], BoundedConnectionPool)
+        assert pools[0].maxconn == 2
+        assert pools[0]._kwargs["connection_factory"] is PooledConnection
+        database.atexit.register.assert_called_once_with(Database.close_pool)
+
+    def test_close_pool(self, fresh_pool, fake_connect):
+        """close_pool ですべての接続を閉じ、次の要求で新しいプールを作成することを確認"""
+        connection_pool = Database._get_pool()
+        conn = connection_pool.getconn()
+
+        Database.close_pool()
+
+        assert connection_pool.closed
+        assert conn.close.call_args_list == [call()]
+        assert Database._pool is None
+        assert Database._get_pool() is not connection_pool
+
+
+@pytest.mark.unit
+class TestBoundedConnectionPool:
+    """空き接続を待つコネクションプールのテストクラス"""
+
+    def test_raises_pool_error_after_timeout(self, fake_connect):
+        """すべての接続が貸し出し中の場合、acquire_timeout 秒だけ待って PoolError を送出することを確認"""
+        connection_pool = BoundedConnectionPool(0, 1, acquire_timeout=0.1)
+        connection_pool.getconn()
+
+        started = time.monotonic()
+        with pytest.raises(pool.PoolError, match="exhausted"):
+            connection_pool.getconn()
+
+        assert 0.1 <= time.monotonic() - started < 1
+
+    def test_waits_for_returned_connection(self, fake_connect):
+        """他のスレッドが接続を返却すれば、待機中の取得が成功することを確認"""
+        connection_pool = BoundedConnectionPool(0, 1, acquire_timeout=5)
+        conn = connection_pool.getconn()
+        timer = threading.Timer(0.1, connection_pool.putconn, args=(conn,))
+        timer.start()
+        try:
+            started = time.monotonic()
+            assert connection_pool.getconn() is not None
+        finally:
+            timer.cancel()
+
+        assert time.monotonic() - started < 1
+
+    def test_get_connection_does_not_back_off_when_exhausted(self, fake_connect, monkeypatch):
+        """プールの枯渇は指数バックオフでリトライせずにエラーとすることを確認"""
+        connection_pool = BoundedConnectionPool(0, 1, acquire_timeout=0.01)
+        connection_pool.getconn()
+        monkeypatch.setattr(Database, "_get_pool", classmethod(lambda cls: connection_pool))
+        sleep = Mock()
+        monkeypatch.setattr(database.time, "sleep", sleep)
+
+        with pytest.raises(pool.PoolError):
+            with Database.get_connection():
+                pass
+
+        sleep.assert_not_called()
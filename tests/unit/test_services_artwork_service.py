@@ -4,99 +4,65 @@
 モックリポジトリを使用してビジネスロジックをテストします。
 """
 
+import json
 import pytest
-from unittest.mock import Mock, patch
-from services.artwork_service import ArtworkService
-from domain.artwork import Artwork
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from unittest.mock import Mock, patch
+from services import artwork_service
+from services.artwork_service import ArtworkService, encode_artworks
+from repositories.artwork_repository import ArtworkRepository
+
+
+@pytest.fixture(scope="module")
+def mock_repository():
+    """モジュール内で共有するモックリポジトリ（各テストの終了後にリセットする）"""
+    return Mock(spec=ArtworkRepository)
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_repository(mock_repository):
+    """テスト間で呼び出し履歴と戻り値を共有しないようにする"""
+    yield
+    mock_repository.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def service(mock_repository):
+    """モックリポジトリを注入した ArtworkService（キャッシュを共有しないようテストごとに作成する）"""
+    return ArtworkService(repository=mock_repository)
 
 
 @pytest.mark.unit
 class TestArtworkService:
     """作品サービスのテストクラス"""
 
-    def test_get_all_artworks(self):
-        """すべての作品を取得する機能をテスト"""
-        # モックリポジトリの作成
-        mock_repository = Mock()
-        mock_artworks = [
-            Artwork(
-                id=1,
-                title="作品1",
-                description=None,
-                image_url=None,
-                price=Decimal("50000"),
-                size=None,
-                medium=None,
-                year=None,
-            ),
-            Artwork(
-                id=2,
-                title="作品2",
-                description=None,
-                image_url=None,
-                price=Decimal("80000"),
-                size=None,
-                medium=None,
-                year=None,
+    @pytest.mark.parametrize(
+        "method, kwargs, expected",
+        [
+            ("get_all_artworks", {}, {"featured": None, "sold": None, "limit": 100, "offset": 0}),
+            (
+                "get_all_artworks",
+                {"featured": True, "limit": 20, "offset": 40},
+                {"featured": True, "sold": None, "limit": 20, "offset": 40},
             ),
-        ]
+            ("get_featured_artworks", {}, {"featured": True, "limit": 100, "offset": 0}),
+            ("get_available_artworks", {"limit": 10}, {"sold": False, "limit": 10, "offset": 0}),
+        ],
+    )
+    def test_find_all_filters(self, service, mock_repository, artwork_50k, method, kwargs, expected):
+        """各取得メソッドがフィルタ条件を付けてリポジトリから取得することを確認"""
+        mock_artworks = [artwork_50k]
         mock_repository.find_all.return_value = mock_artworks
 
-        # サービスの作成（モックリポジトリを注入）
-        service = ArtworkService(repository=mock_repository)
-
-        # テスト実行
-        result = service.get_all_artworks()
-
-        # 検証
-        assert len(result) == 2
-        assert result[0].title == "作品1"
-        assert result[1].title == "作品2"
-        mock_repository.find_all.assert_called_once_with(featured=None, sold=None)
-
-    def test_get_all_artworks_with_filters(self):
-        """フィルタリング機能をテスト"""
-        mock_repository = Mock()
-        mock_artworks = [
-            Artwork(
-                id=1,
-                title="おすすめ作品",
-                description=None,
-                image_url=None,
-                price=None,
-                size=None,
-                medium=None,
-                year=None,
-                is_featured=True,
-            )
-        ]
-        mock_repository.find_all.return_value = mock_artworks
+        result = getattr(service, method)(**kwargs)
 
-        service = ArtworkService(repository=mock_repository)
+        assert result == mock_artworks
+        mock_repository.find_all.assert_called_once_with(**expected)
 
-        result = service.get_all_artworks(featured=True)
-
-        assert len(result) == 1
-        assert result[0].is_featured is True
-        mock_repository.find_all.assert_called_once_with(featured=True, sold=None)
-
-    def test_get_artwork_by_id_success(self):
+    def test_get_artwork_by_id_success(self, service, mock_repository, artwork_50k):
         """IDで作品を取得する機能をテスト（成功ケース）"""
-        mock_repository = Mock()
-        mock_artwork = Artwork(
-            id=1,
-            title="テスト作品",
-            description=None,
-            image_url=None,
-            price=Decimal("50000"),
-            size=None,
-            medium=None,
-            year=None,
-        )
-        mock_repository.find_by_id.return_value = mock_artwork
-
-        service = ArtworkService(repository=mock_repository)
+        mock_repository.find_by_id.return_value = artwork_50k
 
         result = service.get_artwork_by_id(1)
 
@@ -104,64 +70,143 @@ class TestArtworkService:
         assert result.title == "テスト作品"
         mock_repository.find_by_id.assert_called_once_with(1)
 
-    def test_get_artwork_by_id_not_found(self):
+    def test_get_artwork_by_id_not_found(self, service, mock_repository):
         """IDで作品を取得する機能をテスト（見つからないケース）"""
-        mock_repository = Mock()
         mock_repository.find_by_id.return_value = None
 
-        service = ArtworkService(repository=mock_repository)
-
         with pytest.raises(ValueError, match="作品ID 1 が見つかりません"):
             service.get_artwork_by_id(1)
 
-    def test_get_featured_artworks(self):
-        """おすすめ作品を取得する機能をテスト"""
-        mock_repository = Mock()
-        mock_artworks = [
-            Artwork(
-                id=1,
-                title="おすすめ作品",
-                description=None,
-                image_url=None,
-                price=None,
-                size=None,
-                medium=None,
-                year=None,
-                is_featured=True,
-            )
-        ]
-        mock_repository.find_all.return_value = mock_artworks
+    def test_get_artworks_by_ids(self, service, mock_repository, make_artwork):
+        """複数のIDの作品をまとめて取得する機能をテスト"""
+        mock_artworks = [make_artwork(id=id_, title=f"作品{id_}") for id_ in (2, 1)]
+        mock_repository.find_by_ids.return_value = mock_artworks
 
-        service = ArtworkService(repository=mock_repository)
-
-        result = service.get_featured_artworks()
-
-        assert len(result) == 1
-        assert result[0].is_featured is True
-        mock_repository.find_all.assert_called_once_with(featured=True)
-
-    def test_get_available_artworks(self):
-        """購入可能な作品を取得する機能をテスト"""
-        mock_repository = Mock()
-        mock_artworks = [
-            Artwork(
-                id=1,
-                title="購入可能作品",
-                description=None,
-                image_url=None,
-                price=None,
-                size=None,
-                medium=None,
-                year=None,
-                is_sold=False,
-            )
-        ]
+        result = service.get_artworks_by_ids([1, 2, 3])
+
+        assert set(result) == {1, 2}
+        assert result[1].title == "作品1"
+        mock_repository.find_by_ids.assert_called_once_with([1, 2, 3])
+
+    def test_get_all_artworks_json(self, service, mock_repository, artwork_50k):
+        """作品一覧を JSON で取得し、2回目以降はキャッシュを返すことを確認"""
+        mock_artworks = [artwork_50k]
         mock_repository.find_all.return_value = mock_artworks
 
-        service = ArtworkService(repository=mock_repository)
+        first = service.get_all_artworks_json(featured=True)
+        second = service.get_all_artworks_json(featured=True)
+
+        assert first == encode_artworks(mock_artworks)
+        assert second is first
+        mock_repository.find_all.assert_called_once_with(
+            featured=True, sold=None, limit=101, offset=0
+        )
+
+    def test_get_all_artworks_json_after_invalidate_cache(self, service, mock_repository):
+        """キャッシュを破棄すると再度リポジトリから取得することを確認"""
+        mock_repository.find_all.return_value = []
+
+        assert service.get_all_artworks_json() == b"[]"
+        service.invalidate_cache()
+        assert service.get_all_artworks_json() == b"[]"
+
+        assert mock_repository.find_all.call_count == 2
+
+    def test_get_artwork_list(self, service, mock_repository):
+        """ETag は作品テーブルのバージョンとフィルタ条件から作られ、JSON と同じエントリから返すことを確認"""
+        mock_repository.find_all.return_value = []
+        mock_repository.get_version.return_value = "abc"
+
+        assert service.get_artwork_list(featured=True) == ("abc-True-None-100-0", b"[]", False)
+        assert service.get_all_artworks_json(featured=True) == b"[]"
+        mock_repository.get_version.assert_called_once_with()
+        mock_repository.find_all.assert_called_once_with(
+            featured=True, sold=None, limit=101, offset=0
+        )
+
+    def test_get_artwork_list_pages(self, service, mock_repository, make_artwork):
+        """1件多く取得して次のページの有無を判定し、limit 件だけを JSON にすることを確認"""
+        mock_repository.find_all.return_value = [make_artwork(id=id_) for id_ in (1, 2, 3)]
+        mock_repository.get_version.return_value = "abc"
+
+        etag, body, has_more = service.get_artwork_list(limit=2, offset=4)
+
+        assert etag == "abc-None-None-2-4"
+        assert [artwork["id"] for artwork in json.loads(body)] == [1, 2]
+        assert has_more is True
+        mock_repository.find_all.assert_called_once_with(
+            featured=None, sold=None, limit=3, offset=4
+        )
+
+    @pytest.mark.parametrize(
+        "limit, offset", [(0, 0), (artwork_service.MAX_PAGE_SIZE + 1, 0), (10, -1)]
+    )
+    def test_get_artwork_list_rejects_invalid_page(self, service, mock_repository, limit, offset):
+        """範囲外の limit・offset は問い合わせずに ValueError を送出することを確認"""
+        with pytest.raises(ValueError):
+            service.get_artwork_list(limit=limit, offset=offset)
 
-        result = service.get_available_artworks()
+        mock_repository.find_all.assert_not_called()
+
+    def test_list_cache_is_bounded(self, service, mock_repository):
+        """キャッシュするページ数が上限を超えた場合は最も古いページから破棄することを確認"""
+        mock_repository.find_all.return_value = []
+
+        with patch.object(artwork_service, "ARTWORK_LIST_CACHE_MAX_ENTRIES", 2):
+            for offset in (0, 1, 2):
+                service.get_artwork_list(offset=offset)
+
+        assert [key[3] for key in service._json_cache] == [1, 2]
+
+    def test_get_all_artworks_json_expired_but_unchanged(self, service, mock_repository):
+        """有効期限切れでもバージョンが同じであれば作品を取得し直さないことを確認"""
+        mock_repository.find_all.return_value = []
+        mock_repository.get_version.return_value = "abc"
+
+        with patch.object(artwork_service, "ARTWORK_LIST_CACHE_TTL", 0):
+            service.get_all_artworks_json()
+            service.get_all_artworks_json()
+            mock_repository.get_version.return_value = "def"
+            service.get_all_artworks_json()
+
+        assert mock_repository.get_version.call_count == 3
+        assert mock_repository.find_all.call_count == 2
+
+
+
+@pytest.mark.unit
+class TestEncodeArtworks:
+    """作品の JSON シリアライズのテストクラス"""
+
+    @pytest.mark.parametrize(
+        "price",
+        [Decimal("50000"), Decimal("1234.5"), Decimal(0), None],
+        ids=["integer", "fraction", "zero", "none"],
+    )
+    @pytest.mark.parametrize(
+        "created_at",
+        [
+            datetime(2024, 1, 2, 3, 4, 5, 678901),
+            datetime(2024, 1, 2, 3, 4, 5),
+            datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone(timedelta(hours=9))),
+            datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ],
+        ids=["naive", "naive-no-microsecond", "aware", "utc"],
+    )
+    def test_matches_to_dict(self, make_artwork, price, created_at):
+        """Artwork.to_dict() と同じフィールド・値の JSON を出力することを確認"""
+        artwork = make_artwork(price=price, created_at=created_at, updated_at=None)
+
+        assert json.loads(encode_artworks(artwork)) == artwork.to_dict()
+        assert json.loads(encode_artworks([artwork, artwork])) == [artwork.to_dict()] * 2
+
+    def test_without_orjson(self, make_artwork):
+        """orjson がない環境でも、orjson と同じ JSON を出力することを確認"""
+        artworks = [
+            make_artwork(price=Decimal("50000"), created_at=datetime(2024, 1, 2, 3, 4, 5)),
+            make_artwork(id=2, title="作品2", price=Decimal(0)),
+        ]
+        expected = encode_artworks(artworks)
 
-        assert len(result) == 1
-        assert result[0].is_sold is False
-        mock_repository.find_all.assert_called_once_with(sold=False)
+        with patch.object(artwork_service, "orjson", None):
+            assert encode_artworks(artworks) == expected